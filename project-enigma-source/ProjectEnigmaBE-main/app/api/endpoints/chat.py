@@ -79,6 +79,7 @@ def create_initial_workflow_state(request: ChatRequest, workflow_type: str) -> D
             
             # Progress tracking
             "steps_completed": [],
+            "steps_completed_set": set(),
             "steps_failed": [],
         }
     else:  # qa workflow
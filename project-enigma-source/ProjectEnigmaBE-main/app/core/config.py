@@ -40,6 +40,16 @@ class Settings(BaseSettings):
 
     github_token: str = Field(default="", description="GitHub personal access token")
     github_organization: str = Field(default="", description="GitHub organization name")
+    github_concurrency: int = Field(
+        default=5, description="Maximum concurrent GitHub operations per workflow"
+    )
+    github_requests_per_second: float = Field(
+        default=10.0,
+        description=(
+            "Sustained rate of GitHub API requests per process; kept well under "
+            "GitHub's secondary rate limit of 900 REST points per minute"
+        ),
+    )
 
     atlassian_account_id: str = Field(default="", description="Atlassian Account ID")
     confluence_base_url: str = Field(
@@ -50,6 +60,12 @@ class Settings(BaseSettings):
     confluence_space_key: str = Field(
         default="DEV", description="Confluence space key for documentation"
     )
+    http_pool_size: int = Field(
+        default=64, description="Pooled keep-alive connections per API host"
+    )
+    http_connect_retries: int = Field(
+        default=3, description="Retries for failed connections to API hosts"
+    )
 
     # Feature flags
     use_mock_apis: bool = Field(
@@ -69,6 +85,10 @@ class Settings(BaseSettings):
     chat_history_directory: str = Field(
         default="data/chat_history", description="Chat history storage directory"
     )
+    workflow_checkpoint_path: str = Field(
+        default="",
+        description="SQLite file for workflow checkpoints (empty keeps them in memory)",
+    )
 
     # Security settings
     secret_key: str = Field(
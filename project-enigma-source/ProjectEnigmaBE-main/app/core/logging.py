@@ -262,6 +262,11 @@ def context_processor(logger: Any, name: str, event_dict: EventDict) -> EventDic
     return event_dict
 
 
+# Minimum level handed to structlog's filtering logger; everything passes
+# until setup_enhanced_logging has run
+_min_log_level = logging.NOTSET
+
+
 def setup_enhanced_logging(
     log_level: str = "INFO",
     enable_json: bool = False,
@@ -277,11 +282,14 @@ def setup_enhanced_logging(
         enable_security_sanitization: Whether to sanitize sensitive information
         enable_alerts: Whether to enable alert integration
     """
+    global _min_log_level
+    _min_log_level = getattr(logging, log_level.upper())
+
     # Configure standard logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=_min_log_level,
     )
     
     # Build processor chain
@@ -317,9 +325,7 @@ def setup_enhanced_logging(
     # Configure structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(_min_log_level),
         logger_factory=structlog.WriteLoggerFactory(),
         context_class=structlog.threadlocal.wrap_dict(dict),
         cache_logger_on_first_use=True,
@@ -333,6 +339,11 @@ class EnhancedLogger:
         self.logger = structlog.get_logger(name)
         self.name = name
     
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether messages at the given level would be emitted."""
+        # structlog 23.2's filtering loggers have no is_enabled_for of their own
+        return logging.getLevelName(level.upper()) >= _min_log_level
+    
     def debug(self, message: str, **kwargs):
         """Log debug message."""
         self.logger.debug(message, **kwargs)
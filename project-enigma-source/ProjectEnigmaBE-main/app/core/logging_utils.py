@@ -402,17 +402,17 @@ def log_workflow_function(
         log_errors: Whether to log errors with full traceback
     """
     def decorator(func: Callable) -> Callable:
+        # Function metadata is fixed, so resolve it once rather than per call
+        func_name = func.__name__
+        module_name = func.__module__
+        file_name = inspect.getfile(func)
+        line_number = inspect.getsourcelines(func)[1]
+        
+        # Create logger
+        logger = get_logger(f"workflow.{module_name}.{func_name}")
+        
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Get function metadata
-            func_name = func.__name__
-            module_name = func.__module__
-            file_name = inspect.getfile(func)
-            line_number = inspect.getsourcelines(func)[1]
-            
-            # Create logger
-            logger = get_logger(f"workflow.{module_name}.{func_name}")
-            
             # Extract workflow state if available
             workflow_state = {}
             if args and isinstance(args[0], dict):
@@ -430,7 +430,8 @@ def log_workflow_function(
                 "is_async": True
             }
             
-            if include_state and workflow_state:
+            # Sanitizing the whole state is costly; skip it when the call log is filtered
+            if include_state and workflow_state and logger.is_enabled_for(level.value):
                 log_context["workflow_state"] = SecuritySanitizer.sanitize_dict(workflow_state)
             
             if kwargs:
@@ -506,15 +507,6 @@ def log_workflow_function(
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            # Get function metadata
-            func_name = func.__name__
-            module_name = func.__module__
-            file_name = inspect.getfile(func)
-            line_number = inspect.getsourcelines(func)[1]
-            
-            # Create logger
-            logger = get_logger(f"workflow.{module_name}.{func_name}")
-            
             # Extract workflow state if available
             workflow_state = {}
             if args and isinstance(args[0], dict):
@@ -532,7 +524,8 @@ def log_workflow_function(
                 "is_async": False
             }
             
-            if include_state and workflow_state:
+            # Sanitizing the whole state is costly; skip it when the call log is filtered
+            if include_state and workflow_state and logger.is_enabled_for(level.value):
                 log_context["workflow_state"] = SecuritySanitizer.sanitize_dict(workflow_state)
             
             if kwargs:
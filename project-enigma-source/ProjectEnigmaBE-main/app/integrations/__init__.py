@@ -14,11 +14,17 @@ from .exceptions import (
     JiraError,
     RateLimitError,
 )
-from .factory import create_api_clients, get_api_factory, validate_api_connections
+from .factory import (
+    create_api_clients,
+    get_api_clients,
+    get_api_factory,
+    validate_api_connections,
+)
 from .rate_limiter import get_rate_limiter
 
 __all__ = [
     "create_api_clients",
+    "get_api_clients",
     "validate_api_connections",
     "get_api_factory",
     "AuthenticationManager",
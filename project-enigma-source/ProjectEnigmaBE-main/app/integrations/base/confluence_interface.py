@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from ..exceptions import ConfluencePageNotFoundError
+
 
 class ConfluencePage(BaseModel):
     """Confluence page model."""
@@ -22,6 +24,7 @@ class ConfluencePage(BaseModel):
     updated_at: str
     author: str
     version: int
+    etag: Optional[str] = None
 
 
 class ConfluenceSpace(BaseModel):
@@ -70,6 +73,32 @@ class ConfluenceInterface(ABC):
         """
         pass
 
+    async def get_page_if_modified(
+        self, page_id: str, etag: Optional[str] = None
+    ) -> Optional[ConfluencePage]:
+        """
+        Get a page only if it changed since the given ETag was issued.
+
+        Clients that support conditional requests override this to send
+        If-None-Match; the default falls back to a plain get_page.
+
+        Args:
+            page_id: The page ID
+            etag: ETag from a previous fetch of the page
+
+        Returns:
+            Optional[ConfluencePage]: The current page, or None if unchanged
+
+        Raises:
+            ConfluencePageNotFoundError: If the page no longer exists
+        """
+        page = await self.get_page(page_id)
+        if page is None:
+            raise ConfluencePageNotFoundError(page_id)
+        if etag is not None and page.etag == etag:
+            return None
+        return page
+
     @abstractmethod
     async def create_page(
         self, space_key: str, title: str, content: str, parent_id: Optional[str] = None
@@ -108,7 +137,7 @@ class ConfluenceInterface(ABC):
 
     @abstractmethod
     async def search_pages(
-        self, space_key: str, title: Optional[str] = None
+        self, space_key: str, title: Optional[str] = None, include_content: bool = True
     ) -> List[ConfluencePage]:
         """
         Search for pages in a space.
@@ -116,6 +145,8 @@ class ConfluenceInterface(ABC):
         Args:
             space_key: Space to search in
             title: Optional title filter
+            include_content: Whether to fetch page bodies; metadata-only
+                searches may leave content unset
 
         Returns:
             List[ConfluencePage]: List of matching pages
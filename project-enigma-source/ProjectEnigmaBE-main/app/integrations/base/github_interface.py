@@ -4,8 +4,9 @@ GitHub API Interface
 Abstract base class defining the contract for GitHub API operations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -57,6 +58,14 @@ class GitHubRepository(BaseModel):
     private: bool
 
 
+class GitHubRepositoryBundle(BaseModel):
+    """Repository information together with its branches and tags."""
+
+    repository: GitHubRepository
+    branches: Optional[List[GitHubBranch]] = None
+    tags: Optional[List[GitHubTag]] = None
+
+
 class GitHubInterface(ABC):
     """Abstract interface for GitHub API operations."""
 
@@ -129,6 +138,62 @@ class GitHubInterface(ABC):
         """
         pass
 
+    async def batch_merged_status(
+        self, repo_name: str, base_branch: str, head_branches: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Check whether several branches are merged into a base branch.
+
+        Implementations backed by a batching API should override this; the
+        default issues one check_merge_status call per branch.
+
+        Args:
+            repo_name: Repository name in format "owner/repo"
+            base_branch: Branch the heads should be merged into
+            head_branches: Branch names to check
+
+        Returns:
+            Dict[str, bool]: Map of head branch to merged flag
+        """
+        statuses = await asyncio.gather(
+            *(
+                self.check_merge_status(repo_name, head, base_branch)
+                for head in head_branches
+            )
+        )
+        return {
+            head: bool(status.get("merged"))
+            for head, status in zip(head_branches, statuses)
+        }
+
+    async def bulk_branch_exists(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], bool]:
+        """
+        Check whether branches exist across several repositories.
+
+        Implementations backed by a batching API should override this; the
+        default lists the branches of each distinct repository once.
+
+        Args:
+            pairs: (repository name, branch name) pairs to check
+
+        Returns:
+            Dict[Tuple[str, str], bool]: Map of pair to existence flag
+        """
+        repositories = list(dict.fromkeys(repo_name for repo_name, _ in pairs))
+        listings = await asyncio.gather(
+            *(self.get_branches(repo_name) for repo_name in repositories)
+        )
+        names = {
+            repo_name: {branch.name for branch in branches}
+            for repo_name, branches in zip(repositories, listings)
+        }
+        return {
+            (repo_name, branch_name): branch_name in names[repo_name]
+            for repo_name, branch_name in pairs
+        }
+
     @abstractmethod
     async def create_pull_request(
         self, repo_name: str, title: str, body: str, head_branch: str, base_branch: str
@@ -199,6 +264,32 @@ class GitHubInterface(ABC):
         """
         pass
 
+    async def bulk_create_branches(
+        self, pairs: List[Tuple[str, str]], source_branch: str = "main"
+    ) -> Dict[Tuple[str, str], Union[GitHubBranch, Exception]]:
+        """
+        Create branches across several repositories from the same source branch.
+
+        Implementations backed by a batching API should override this; the
+        default issues one create_branch call per pair.
+
+        Args:
+            pairs: (repository name, new branch name) pairs to create
+            source_branch: Branch to create each new branch from
+
+        Returns:
+            Dict[Tuple[str, str], Union[GitHubBranch, Exception]]: Map of pair to
+            the created branch, or to the error that prevented its creation
+        """
+        results = await asyncio.gather(
+            *(
+                self.create_branch(repo_name, branch_name, source_branch)
+                for repo_name, branch_name in pairs
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(pairs, results))
+
     @abstractmethod
     async def create_tag(
         self, repo_name: str, tag_name: str, sha: str, message: str
@@ -230,6 +321,39 @@ class GitHubInterface(ABC):
         """
         pass
 
+    async def get_repository_bundle(
+        self, repo_name: str, include_branches: bool = True, include_tags: bool = True
+    ) -> Optional[GitHubRepositoryBundle]:
+        """
+        Get repository information together with its branches and tags.
+
+        Implementations backed by a batching API should override this; the
+        default looks up the repository, then its branches and tags concurrently.
+
+        Args:
+            repo_name: Repository name in format "owner/repo"
+            include_branches: Whether to fetch the repository's branches
+            include_tags: Whether to fetch the repository's tags
+
+        Returns:
+            Optional[GitHubRepositoryBundle]: Repository with the requested
+            branches and tags, or None if the repository was not found
+        """
+        repository = await self.get_repository(repo_name)
+        if repository is None:
+            return None
+
+        async def _skip() -> None:
+            return None
+
+        branches, tags = await asyncio.gather(
+            self.get_branches(repo_name) if include_branches else _skip(),
+            self.get_tags(repo_name) if include_tags else _skip(),
+        )
+        return GitHubRepositoryBundle(
+            repository=repository, branches=branches, tags=tags
+        )
+
     @abstractmethod
     async def validate_connection(self) -> Dict[str, Any]:
         """
@@ -7,7 +7,7 @@ between mock and real implementations.
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ..core.config import get_settings
 from .auth_manager import AuthenticationManager
@@ -246,7 +246,7 @@ class APIClientFactory:
 
 
 # Global factory instance
-_global_factory: APIClientFactory = None
+_global_factory: Optional[APIClientFactory] = None
 
 
 def get_api_factory() -> APIClientFactory:
@@ -257,6 +257,33 @@ def get_api_factory() -> APIClientFactory:
     return _global_factory
 
 
+# Client sets shared across the process, keyed by mock setting
+_shared_clients: Dict[bool, APIClients] = {}
+
+
+def get_api_clients(use_mock: Optional[bool] = None) -> APIClients:
+    """
+    Get the API clients shared across the process.
+
+    Unlike create_api_clients, repeated calls return the same client instances,
+    so their connections and authentication state are reused.
+
+    Args:
+        use_mock: Override mock setting
+
+    Returns:
+        APIClients: Shared container with all client instances
+    """
+    factory = get_api_factory()
+    if use_mock is None:
+        use_mock = factory.settings.use_mock_apis
+
+    clients = _shared_clients.get(use_mock)
+    if clients is None:
+        clients = _shared_clients[use_mock] = factory.create_all_clients(use_mock)
+    return clients
+
+
 def create_api_clients(use_mock: bool = None) -> APIClients:
     """
     Convenience function to create all API clients.
@@ -273,7 +273,7 @@ class MockConfluenceClient(ConfluenceInterface):
         raise ValueError(f"Page with ID {page_id} not found")
 
     async def search_pages(
-        self, space_key: str, title: Optional[str] = None
+        self, space_key: str, title: Optional[str] = None, include_content: bool = True
     ) -> List[ConfluencePage]:
         """Search mock pages."""
         await asyncio.sleep(0.2)  # Simulate API delay
@@ -208,27 +208,45 @@ class RateLimiter:
         """
         state = self.states[service]
         current_time = time.time()
+        # HTTP header names are case-insensitive; clients report them either way
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
 
         # GitHub rate limit headers
         if service == "github":
-            remaining = headers.get("X-RateLimit-Remaining")
-            reset_time = headers.get("X-RateLimit-Reset")
+            remaining = headers.get("x-ratelimit-remaining")
+            reset_time = headers.get("x-ratelimit-reset")
+            retry_after = headers.get("retry-after")
 
-            if remaining is not None and int(remaining) == 0 and reset_time:
-                # Rate limited, set next allowed time
-                state.next_allowed_time = float(reset_time)
-                logger.warning(f"GitHub rate limit exceeded. Reset at {reset_time}")
+            if retry_after:
+                # Secondary rate limit
+                state.next_allowed_time = current_time + float(retry_after)
+                logger.warning(
+                    f"GitHub secondary rate limit hit. Retry after {retry_after}s"
+                )
+            elif remaining is not None and reset_time:
+                remaining = int(remaining)
+                reset_time = float(reset_time)
+                if remaining == 0:
+                    # Rate limited, set next allowed time
+                    state.next_allowed_time = reset_time
+                    logger.warning(f"GitHub rate limit exceeded. Reset at {reset_time}")
+                elif remaining < self.configs[service].burst_allowance:
+                    # Nearly exhausted: spread what is left over the rest of the window
+                    state.next_allowed_time = max(
+                        state.next_allowed_time,
+                        current_time + (reset_time - current_time) / remaining,
+                    )
 
         # JIRA rate limit headers (if available)
         elif service == "jira":
-            retry_after = headers.get("Retry-After")
+            retry_after = headers.get("retry-after")
             if retry_after:
                 state.next_allowed_time = current_time + float(retry_after)
                 logger.warning(f"JIRA rate limit exceeded. Retry after {retry_after}s")
 
         # Confluence rate limit headers (if available)
         elif service == "confluence":
-            retry_after = headers.get("Retry-After")
+            retry_after = headers.get("retry-after")
             if retry_after:
                 state.next_allowed_time = current_time + float(retry_after)
                 logger.warning(
@@ -275,6 +293,33 @@ class RateLimiter:
         logger.info("Reset all rate limit states")
 
 
+class TokenBucket:
+    """Token bucket that paces requests to a steady rate while allowing bursts."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        # Tokens may go negative; later callers queue behind earlier reservations
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 # Global rate limiter instance
 _global_rate_limiter: Optional[RateLimiter] = None
 
@@ -17,6 +17,7 @@ if "beautifulsoup4" not in sys.modules:
     sys.modules["beautifulsoup4"] = bs4
 
 from atlassian.confluence import Confluence
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
 from ..base.confluence_interface import (
@@ -64,6 +65,15 @@ class RealConfluenceClient(ConfluenceInterface):
                     cloud=is_cloud,
                     timeout=30,
                 )
+
+                # Keep enough connections per host for concurrent executor calls
+                settings = get_settings()
+                adapter = HTTPAdapter(
+                    pool_maxsize=settings.http_pool_size,
+                    max_retries=settings.http_connect_retries,
+                )
+                self._client._session.mount("https://", adapter)
+                self._client._session.mount("http://", adapter)
             except Exception as e:
                 logger.error(f"Failed to create Confluence client: {str(e)}")
                 raise APIConnectionError("Confluence", self.base_url, str(e))
@@ -335,6 +345,56 @@ class RealConfluenceClient(ConfluenceInterface):
             )
             raise ConfluenceError(f"Failed to get page: {str(e)}")
 
+    async def get_page_if_modified(
+        self, page_id: str, etag: Optional[str] = None
+    ) -> Optional[ConfluencePage]:
+        """Get a page with If-None-Match, returning None on 304 Not Modified."""
+        try:
+            await self.rate_limiter.acquire("confluence", "get_page")
+
+            client = self._get_client()
+
+            headers = dict(client.default_headers)
+            if etag:
+                headers["If-None-Match"] = etag
+
+            # advanced_mode hands back the raw response so 304 is not an error
+            response = await asyncio.get_event_loop().run_in_executor(
+                None,
+                lambda: client.get(
+                    f"rest/api/content/{page_id}",
+                    params={"expand": "version,space,history.createdBy"},
+                    headers=headers,
+                    advanced_mode=True,
+                ),
+            )
+
+            if response.status_code == 304:
+                return None
+            if response.status_code == 404:
+                raise ConfluencePageNotFoundError(page_id)
+            response.raise_for_status()
+
+            page = self._convert_confluence_page(response.json())
+            page.etag = response.headers.get("ETag")
+            return page
+
+        except ConfluencePageNotFoundError:
+            raise
+        except HTTPError as e:
+            if e.response.status_code == 429:
+                raise ConfluenceRateLimitError()
+            elif e.response.status_code == 401:
+                raise ConfluenceAuthenticationError("Authentication expired")
+            else:
+                logger.error(f"Confluence conditional get page failed: {str(e)}")
+                raise ConfluenceError(f"Failed to get page {page_id}: {str(e)}")
+        except Exception as e:
+            logger.error(
+                f"Unexpected error getting Confluence page {page_id}: {str(e)}"
+            )
+            raise ConfluenceError(f"Failed to get page: {str(e)}")
+
     async def create_page(
         self, space_key: str, title: str, content: str, parent_id: Optional[str] = None
     ) -> ConfluencePage:
@@ -434,7 +494,7 @@ class RealConfluenceClient(ConfluenceInterface):
             raise ConfluenceError(f"Failed to update page: {str(e)}")
 
     async def search_pages(
-        self, space_key: str, title: Optional[str] = None
+        self, space_key: str, title: Optional[str] = None, include_content: bool = True
     ) -> List[ConfluencePage]:
         """Search for pages in a space."""
         try:
@@ -447,12 +507,14 @@ class RealConfluenceClient(ConfluenceInterface):
             if title:
                 cql += f' AND title ~ "{title}"'
 
+            # Page bodies dominate the response size; only expand them when needed
+            expand = "version,space,history.createdBy"
+            if include_content:
+                expand = f"body.storage,{expand}"
+
             # Search pages
             search_results = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: client.cql(
-                    cql, expand="body.storage,version,space,history.createdBy"
-                ),
+                None, lambda: client.cql(cql, expand=expand)
             )
 
             # Convert to ConfluencePage objects
@@ -7,7 +7,8 @@ Provides real GitHub API integration using the PyGithub library.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from github import Github
 from github.GithubException import (
@@ -16,11 +17,13 @@ from github.GithubException import (
     UnknownObjectException,
 )
 
+from ...core.config import get_settings
 from ..base.github_interface import (
     GitHubBranch,
     GitHubInterface,
     GitHubPullRequest,
     GitHubRepository,
+    GitHubRepositoryBundle,
     GitHubTag,
 )
 from ..exceptions import (
@@ -33,10 +36,19 @@ from ..exceptions import (
     GitHubRepositoryNotFoundError,
     ResourceNotFoundError,
 )
-from ..rate_limiter import get_rate_limiter
+from ..rate_limiter import TokenBucket, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=1)
+def _request_bucket() -> TokenBucket:
+    """Return the token bucket pacing every GitHub request made by this client."""
+    rate = max(1.0, get_settings().github_requests_per_second)
+    return TokenBucket(rate=rate, capacity=rate)
+
 
 class RealGitHubClient(GitHubInterface):
     """Real implementation of GitHub API client using PyGithub."""
@@ -52,13 +64,81 @@ class RealGitHubClient(GitHubInterface):
         """Get or create GitHub client instance."""
         if self._client is None:
             try:
-                self._client = Github(self.token, timeout=30)
+                settings = get_settings()
+                self._client = Github(
+                    self.token,
+                    timeout=30,
+                    retry=settings.http_connect_retries,
+                    pool_size=settings.http_pool_size,
+                )
             except Exception as e:
                 logger.error(f"Failed to create GitHub client: {str(e)}")
                 raise APIConnectionError("GitHub", "https://api.github.com", str(e))
 
         return self._client
 
+    def _requester(self) -> Optional[Any]:
+        """Return PyGithub's private requester, or None if this version hides it.
+
+        This is the only place that reaches into PyGithub internals (written
+        against PyGithub 1.59); callers must cope with it being unavailable.
+        """
+        return getattr(self._get_client(), "_Github__requester", None)
+
+    def _sync_rate_limit(self, headers: Optional[Dict[str, Any]] = None) -> None:
+        """Feed GitHub's latest rate-limit headers into the shared rate limiter."""
+        requester = self._requester()
+        remaining, _ = getattr(requester, "rate_limiting", (-1, -1))
+        if remaining >= 0:
+            headers = {
+                "X-RateLimit-Remaining": remaining,
+                "X-RateLimit-Reset": requester.rate_limiting_resettime,
+                **(headers or {}),
+            }
+        if headers:
+            self.rate_limiter.update_from_headers("github", headers)
+
+    def _rate_limit_delay(
+        self, error: GithubException, attempt: int
+    ) -> Optional[float]:
+        """Return how long to wait before retrying a rate-limited call, else None."""
+        if error.status not in (403, 429):
+            return None
+        headers = {key.lower(): value for key, value in (error.headers or {}).items()}
+        retry_after = headers.get("retry-after")
+        if retry_after is None and str(headers.get("x-ratelimit-remaining")) != "0":
+            # A plain permission error, not a rate limit
+            return None
+        # Exponential back-off (2, 4, 8 s with jitter), never shorter than Retry-After
+        backoff = self.rate_limiter._calculate_backoff_delay("github", attempt + 1)
+        return max(float(retry_after or 0), backoff)
+
+    async def _run(self, func: Callable[[], _T]) -> _T:
+        """Run a blocking PyGithub call in the executor, tracking rate-limit headers.
+
+        Calls rejected by a primary or secondary rate limit are retried with
+        back-off up to the configured number of retries.
+        """
+        max_retries = self.rate_limiter.configs["github"].max_retries
+        for attempt in range(max_retries + 1):
+            await _request_bucket().acquire()
+            try:
+                result = await asyncio.get_event_loop().run_in_executor(None, func)
+            except GithubException as e:
+                # Secondary limits only announce themselves through Retry-After
+                self._sync_rate_limit(e.headers)
+                delay = self._rate_limit_delay(e, attempt)
+                if delay is None or attempt == max_retries:
+                    raise
+                logger.warning(
+                    f"GitHub rate limit hit; retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            self._sync_rate_limit()
+            return result
+
     def _convert_github_branch(self, branch, repo_full_name: str) -> GitHubBranch:
         """Convert GitHub branch object to GitHubBranch model."""
         try:
@@ -146,9 +226,7 @@ class RealGitHubClient(GitHubInterface):
             client = self._get_client()
 
             # Test authentication by getting user info
-            user = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_user()
-            )
+            user = await self._run(lambda: client.get_user())
 
             self._authenticated = True
             logger.info(f"Successfully authenticated with GitHub as {user.login}")
@@ -179,9 +257,7 @@ class RealGitHubClient(GitHubInterface):
             client = self._get_client()
 
             # Get repository
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             return self._convert_github_repo(repo)
 
@@ -210,14 +286,10 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "get_branches")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Get branches
-            branches = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: list(repo.get_branches())
-            )
+            branches = await self._run(lambda: list(repo.get_branches()))
 
             # Convert to GitHubBranch objects
             github_branches = []
@@ -289,13 +361,11 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "compare_branches")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Compare branches
-            comparison = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: repo.compare(target_branch, source_branch)
+            comparison = await self._run(
+                lambda: repo.compare(target_branch, source_branch)
             )
 
             # Check if branches are identical (merged)
@@ -326,6 +396,118 @@ class RealGitHubClient(GitHubInterface):
             logger.error(f"Unexpected error comparing branches: {str(e)}")
             raise GitHubError(f"Failed to compare branches: {str(e)}")
 
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query through the PyGithub requester and return its payload."""
+        try:
+            await self.rate_limiter.acquire("github", "graphql")
+
+            requester = self._requester()
+            if requester is None:
+                raise GitHubError(
+                    "GraphQL queries are not supported by this PyGithub version"
+                )
+
+            # _run feeds the response's rate-limit headers to the limiter
+            _, data = await self._run(
+                lambda: requester.requestJsonAndCheck(
+                    "POST", "/graphql", input={"query": query, "variables": variables}
+                ),
+            )
+            return data
+
+        except GithubException as e:
+            if e.status == 429:
+                raise GitHubRateLimitError()
+            elif e.status == 401:
+                raise GitHubAuthenticationError("Authentication expired")
+            else:
+                logger.error(f"GitHub GraphQL query failed: {str(e)}")
+                raise GitHubError(f"GraphQL query failed: {str(e)}")
+
+    async def batch_merged_status(
+        self, repo_name: str, base_branch: str, head_branches: List[str]
+    ) -> Dict[str, bool]:
+        """Check merge status of many branches with a single GraphQL query."""
+        if not head_branches:
+            return {}
+
+        owner, _, name = repo_name.partition("/")
+        variables: Dict[str, Any] = {
+            "owner": owner,
+            "name": name,
+            "base": f"refs/heads/{base_branch}",
+        }
+        declarations = ["$owner: String!", "$name: String!", "$base: String!"]
+        fields = []
+        for index, head in enumerate(head_branches):
+            variables[f"h{index}"] = head
+            declarations.append(f"$h{index}: String!")
+            fields.append(f"b{index}: compare(headRef: $h{index}) {{ aheadBy }}")
+
+        query = (
+            f"query({', '.join(declarations)}) {{ "
+            "repository(owner: $owner, name: $name) { "
+            f"ref(qualifiedName: $base) {{ {' '.join(fields)} }} }} }}"
+        )
+
+        data = await self._graphql(query, variables)
+        if data.get("errors"):
+            raise GitHubError(f"GraphQL merge status query failed: {data['errors']}")
+
+        repository = (data.get("data") or {}).get("repository")
+        if repository is None:
+            raise GitHubRepositoryNotFoundError(repo_name)
+        ref = repository.get("ref")
+        if ref is None:
+            raise GitHubBranchNotFoundError(base_branch)
+
+        # A head is merged when it has no commits that the base lacks
+        return {
+            head: (ref.get(f"b{index}") or {}).get("aheadBy") == 0
+            for index, head in enumerate(head_branches)
+        }
+
+    async def bulk_branch_exists(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], bool]:
+        """Check existence of many (repository, branch) pairs with one GraphQL query."""
+        if not pairs:
+            return {}
+
+        variables: Dict[str, Any] = {}
+        declarations = []
+        fields = []
+        for index, (repo_name, branch_name) in enumerate(pairs):
+            owner, _, name = repo_name.partition("/")
+            variables.update(
+                {
+                    f"o{index}": owner,
+                    f"n{index}": name,
+                    f"q{index}": f"refs/heads/{branch_name}",
+                }
+            )
+            declarations.append(
+                f"$o{index}: String!, $n{index}: String!, $q{index}: String!"
+            )
+            fields.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+                f"{{ ref(qualifiedName: $q{index}) {{ name }} }}"
+            )
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+
+        data = await self._graphql(query, variables)
+        results = data.get("data") or {}
+        if data.get("errors") and not results:
+            raise GitHubError(f"GraphQL branch query failed: {data['errors']}")
+
+        # Repositories that could not be resolved are left out of the result
+        return {
+            pair: results[f"r{index}"].get("ref") is not None
+            for index, pair in enumerate(pairs)
+            if results.get(f"r{index}") is not None
+        }
+
     async def create_pull_request(
         self, repo_name: str, title: str, body: str, head_branch: str, base_branch: str
     ) -> GitHubPullRequest:
@@ -334,13 +516,10 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "create_pr")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Create pull request
-            pr = await asyncio.get_event_loop().run_in_executor(
-                None,
+            pr = await self._run(
                 lambda: repo.create_pull(
                     title=title, body=body, head=head_branch, base=base_branch
                 ),
@@ -378,14 +557,10 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "merge_pr")
 
             client = self._get_client()
-            github_repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo)
-            )
+            github_repo = await self._run(lambda: client.get_repo(repo))
 
             # Get the pull request
-            pr = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: github_repo.get_pull(pr_number)
-            )
+            pr = await self._run(lambda: github_repo.get_pull(pr_number))
 
             # Check if PR is already merged
             if pr.merged:
@@ -404,12 +579,11 @@ class RealGitHubClient(GitHubInterface):
                 )
 
             # Merge the pull request
-            merge_result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: pr.merge(merge_method=merge_method),
-            )
+            merge_result = await self._run(lambda: pr.merge(merge_method=merge_method))
 
-            logger.info(f"Successfully merged PR #{pr_number} using {merge_method} method")
+            logger.info(
+                f"Successfully merged PR #{pr_number} using {merge_method} method"
+            )
             return {
                 "merged": True,
                 "sha": merge_result.sha,
@@ -454,18 +628,13 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "merge_branches")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Get source branch SHA
-            source_ref = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: repo.get_branch(source_branch)
-            )
+            source_ref = await self._run(lambda: repo.get_branch(source_branch))
 
             # Merge branches
-            merge = await asyncio.get_event_loop().run_in_executor(
-                None,
+            merge = await self._run(
                 lambda: repo.merge(
                     base=target_branch,
                     head=source_ref.commit.sha,
@@ -507,27 +676,20 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "create_branch")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Get source branch SHA
-            source_ref = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: repo.get_branch(source_branch)
-            )
+            source_ref = await self._run(lambda: repo.get_branch(source_branch))
 
             # Create new branch
-            await asyncio.get_event_loop().run_in_executor(
-                None,
+            await self._run(
                 lambda: repo.create_git_ref(
                     ref=f"refs/heads/{branch_name}", sha=source_ref.commit.sha
                 ),
             )
 
             # Get the created branch
-            new_branch = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: repo.get_branch(branch_name)
-            )
+            new_branch = await self._run(lambda: repo.get_branch(branch_name))
 
             logger.info(f"Created branch {branch_name} from {source_branch}")
             return self._convert_github_branch(new_branch, repo_name)
@@ -553,6 +715,104 @@ class RealGitHubClient(GitHubInterface):
             logger.error(f"Unexpected error creating branch: {str(e)}")
             raise GitHubError(f"Failed to create branch: {str(e)}")
 
+    async def bulk_create_branches(
+        self, pairs: List[Tuple[str, str]], source_branch: str = "main"
+    ) -> Dict[Tuple[str, str], Union[GitHubBranch, Exception]]:
+        """Create many branches with one GraphQL lookup and one createRef mutation.
+
+        Pairs GraphQL does not create, including all of them when a GraphQL
+        request fails outright, are created one by one over REST.
+        """
+        if not pairs:
+            return {}
+
+        # Resolve each repository's node id and source branch head in one query
+        repositories = list(dict.fromkeys(repo_name for repo_name, _ in pairs))
+        variables: Dict[str, Any] = {"s": f"refs/heads/{source_branch}"}
+        declarations = ["$s: String!"]
+        fields = []
+        for index, repo_name in enumerate(repositories):
+            owner, _, name = repo_name.partition("/")
+            variables.update({f"o{index}": owner, f"n{index}": name})
+            declarations.append(f"$o{index}: String!, $n{index}: String!")
+            fields.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+                "{ id ref(qualifiedName: $s) { target { oid } } }"
+            )
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+
+        try:
+            data = await self._graphql(query, variables)
+        except Exception as e:
+            logger.warning(f"GraphQL branch source lookup failed, using REST: {str(e)}")
+            data = {}
+        found = data.get("data") or {}
+        if data.get("errors") and not found:
+            logger.warning(f"GraphQL repository query failed: {data['errors']}")
+
+        sources: Dict[str, Tuple[str, str]] = {}
+        for index, repo_name in enumerate(repositories):
+            repository = found.get(f"r{index}") or {}
+            if repository.get("ref"):
+                sources[repo_name] = (
+                    repository["id"],
+                    repository["ref"]["target"]["oid"],
+                )
+
+        # Create every resolvable ref in a single aliased mutation
+        batched = [pair for pair in pairs if pair[0] in sources]
+        results: Dict[Tuple[str, str], Union[GitHubBranch, Exception]] = {}
+        if batched:
+            variables = {}
+            declarations = []
+            fields = []
+            for index, (repo_name, branch_name) in enumerate(batched):
+                repository_id, oid = sources[repo_name]
+                variables.update(
+                    {
+                        f"r{index}": repository_id,
+                        f"q{index}": f"refs/heads/{branch_name}",
+                        f"s{index}": oid,
+                    }
+                )
+                declarations.append(
+                    f"$r{index}: ID!, $q{index}: String!, $s{index}: GitObjectID!"
+                )
+                fields.append(
+                    f"c{index}: createRef(input: {{repositoryId: $r{index}, "
+                    f"name: $q{index}, oid: $s{index}}}) {{ ref {{ name }} }}"
+                )
+
+            mutation = f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+
+            try:
+                data = await self._graphql(mutation, variables)
+            except Exception as e:
+                logger.warning(
+                    f"GraphQL createRef mutation failed, using REST: {str(e)}"
+                )
+                data = {}
+            created = data.get("data") or {}
+            for index, (repo_name, branch_name) in enumerate(batched):
+                if (created.get(f"c{index}") or {}).get("ref"):
+                    results[(repo_name, branch_name)] = GitHubBranch(
+                        name=branch_name,
+                        sha=sources[repo_name][1],
+                        protected=False,
+                        url=f"https://github.com/{repo_name}/tree/{branch_name}",
+                    )
+            logger.info(
+                f"Created {len(results)} of {len(pairs)} branches "
+                f"from {source_branch} via GraphQL"
+            )
+
+        # Anything GraphQL could not create goes through REST for a precise error
+        remaining = [pair for pair in pairs if pair not in results]
+        if remaining:
+            results.update(await super().bulk_create_branches(remaining, source_branch))
+        return results
+
     async def create_tag(
         self, repo_name: str, tag_name: str, sha: str, message: str
     ) -> GitHubTag:
@@ -561,21 +821,17 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "create_tag")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Create tag
-            tag = await asyncio.get_event_loop().run_in_executor(
-                None,
+            tag = await self._run(
                 lambda: repo.create_git_tag(
                     tag=tag_name, message=message, object=sha, type="commit"
                 ),
             )
 
             # Create reference
-            await asyncio.get_event_loop().run_in_executor(
-                None,
+            await self._run(
                 lambda: repo.create_git_ref(ref=f"refs/tags/{tag_name}", sha=tag.sha),
             )
 
@@ -616,14 +872,10 @@ class RealGitHubClient(GitHubInterface):
             await self.rate_limiter.acquire("github", "get_tags")
 
             client = self._get_client()
-            repo = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_repo(repo_name)
-            )
+            repo = await self._run(lambda: client.get_repo(repo_name))
 
             # Get tags
-            tags = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: list(repo.get_tags())
-            )
+            tags = await self._run(lambda: list(repo.get_tags()))
 
             # Convert to GitHubTag objects
             github_tags = []
@@ -654,6 +906,92 @@ class RealGitHubClient(GitHubInterface):
             logger.error(f"Unexpected error getting GitHub tags: {str(e)}")
             raise GitHubError(f"Failed to get tags: {str(e)}")
 
+    async def get_repository_bundle(
+        self, repo_name: str, include_branches: bool = True, include_tags: bool = True
+    ) -> Optional[GitHubRepositoryBundle]:
+        """Get a repository with its branches and tags in a single GraphQL query."""
+        owner, _, name = repo_name.partition("/")
+        query = (
+            "query($owner: String!, $name: String!, $branches: Boolean!, $tags: Boolean!) { "
+            "repository(owner: $owner, name: $name) { "
+            "name nameWithOwner url isPrivate defaultBranchRef { name } "
+            'branches: refs(refPrefix: "refs/heads/", first: 100) @include(if: $branches) { '
+            "pageInfo { hasNextPage } nodes { name target { oid } branchProtectionRule { id } } } "
+            'tags: refs(refPrefix: "refs/tags/", first: 100) @include(if: $tags) { '
+            "pageInfo { hasNextPage } nodes { name target { oid "
+            "... on Tag { message tagger { email date } target { oid } } } } } } }"
+        )
+        data = await self._graphql(
+            query,
+            {
+                "owner": owner,
+                "name": name,
+                "branches": include_branches,
+                "tags": include_tags,
+            },
+        )
+        repository = (data.get("data") or {}).get("repository")
+        if repository is None:
+            if data.get("errors") and not any(
+                error.get("type") == "NOT_FOUND" for error in data["errors"]
+            ):
+                raise GitHubError(f"GraphQL repository query failed: {data['errors']}")
+            logger.warning(f"GitHub repository not found: {repo_name}")
+            return None
+
+        full_name = repository["nameWithOwner"]
+        bundle = GitHubRepositoryBundle(
+            repository=GitHubRepository(
+                name=repository["name"],
+                full_name=full_name,
+                default_branch=(repository.get("defaultBranchRef") or {}).get(
+                    "name", ""
+                ),
+                url=repository["url"],
+                clone_url=f"{repository['url']}.git",
+                private=repository["isPrivate"],
+            )
+        )
+
+        branches = repository.get("branches")
+        if branches is not None:
+            if branches["pageInfo"]["hasNextPage"]:
+                # More than one page; REST pagination returns the full list
+                bundle.branches = await self.get_branches(repo_name)
+            else:
+                bundle.branches = [
+                    GitHubBranch(
+                        name=node["name"],
+                        sha=node["target"]["oid"],
+                        protected=node.get("branchProtectionRule") is not None,
+                        url=f"https://github.com/{full_name}/tree/{node['name']}",
+                    )
+                    for node in branches["nodes"]
+                ]
+
+        tags = repository.get("tags")
+        if tags is not None:
+            if tags["pageInfo"]["hasNextPage"]:
+                bundle.tags = await self.get_tags(repo_name)
+            else:
+                bundle.tags = []
+                for node in tags["nodes"]:
+                    target = node["target"]
+                    # Annotated tags point at a tag object that wraps the commit
+                    tagger = target.get("tagger") or {}
+                    bundle.tags.append(
+                        GitHubTag(
+                            name=node["name"],
+                            sha=(target.get("target") or target)["oid"],
+                            url=f"https://github.com/{full_name}/releases/tag/{node['name']}",
+                            tagger=tagger.get("email"),
+                            date=tagger.get("date"),
+                            message=target.get("message"),
+                        )
+                    )
+
+        return bundle
+
     async def validate_connection(self) -> Dict[str, Any]:
         """Validate the connection and return user information."""
         try:
@@ -662,14 +1000,10 @@ class RealGitHubClient(GitHubInterface):
             client = self._get_client()
 
             # Get user info
-            user = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.get_user()
-            )
+            user = await self._run(lambda: client.get_user())
 
             # Get organizations
-            orgs = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: list(user.get_orgs())
-            )
+            orgs = await self._run(lambda: list(user.get_orgs()))
 
             return {
                 "status": "connected",
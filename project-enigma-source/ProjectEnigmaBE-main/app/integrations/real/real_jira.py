@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from jira import JIRA
 from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
 
 from ..auth_manager import AuthenticationManager
 from ..base.jira_interface import JiraInterface, JiraTicket
@@ -26,6 +27,12 @@ from ...core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Issue fields read by _convert_jira_issue_to_ticket; requesting only these
+# keeps rendered fields, comments and changelogs out of every response
+_ISSUE_FIELDS = (
+    "summary,status,assignee,fixVersions,issuetype,created,updated,description,project"
+)
+
 
 class RealJiraClient(JiraInterface):
     """Real implementation of JIRA API client using python-jira."""
@@ -47,6 +54,15 @@ class RealJiraClient(JiraInterface):
                     basic_auth=(self.username, self.token),
                     timeout=30,
                 )
+
+                # Keep enough connections per host for concurrent executor calls
+                settings = get_settings()
+                adapter = HTTPAdapter(
+                    pool_maxsize=settings.http_pool_size,
+                    max_retries=settings.http_connect_retries,
+                )
+                self._client._session.mount("https://", adapter)
+                self._client._session.mount("http://", adapter)
             except Exception as e:
                 logger.error(f"Failed to create JIRA client: {str(e)}")
                 raise APIConnectionError("JIRA", self.base_url, str(e))
@@ -138,7 +154,9 @@ class RealJiraClient(JiraInterface):
             # Execute search
             issues = await asyncio.get_event_loop().run_in_executor(
                 None,
-                lambda: client.search_issues(jql, maxResults=1000, expand="changelog"),
+                lambda: client.search_issues(
+                    jql, maxResults=1000, fields=_ISSUE_FIELDS
+                ),
             )
 
             # Convert to tickets
@@ -175,7 +193,7 @@ class RealJiraClient(JiraInterface):
 
             # Get issue
             issue = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: client.issue(ticket_key, expand="changelog")
+                None, lambda: client.issue(ticket_key, fields=_ISSUE_FIELDS)
             )
 
             return self._convert_jira_issue_to_ticket(issue)
@@ -208,7 +226,7 @@ class RealJiraClient(JiraInterface):
             issues = await asyncio.get_event_loop().run_in_executor(
                 None,
                 lambda: client.search_issues(
-                    jql, maxResults=max_results, expand="changelog"
+                    jql, maxResults=max_results, fields=_ISSUE_FIELDS
                 ),
             )
 
@@ -249,16 +267,16 @@ class RealJiraClient(JiraInterface):
                 None, lambda: client.projects()
             )
 
-            # Convert to dict format
+            # Convert to dict format; lead and projectCategory are resources
             project_list = []
             for project in projects:
                 project_dict = {
                     "key": project.key,
                     "name": project.name,
                     "description": getattr(project, "description", ""),
-                    "lead": getattr(project, "lead", {}).get("displayName", ""),
-                    "projectCategory": getattr(project, "projectCategory", {}).get(
-                        "name", ""
+                    "lead": getattr(getattr(project, "lead", None), "displayName", ""),
+                    "projectCategory": getattr(
+                        getattr(project, "projectCategory", None), "name", ""
                     ),
                 }
                 project_list.append(project_dict)
@@ -16,9 +16,9 @@ from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
 
-from .tools.github_tools import GitHubTools
-from .tools.jira_tools import JiraTools
-from .tools.confluence_tools import ConfluenceTools
+from .tools.github_tools import get_github_tools
+from .tools.jira_tools import get_jira_tools
+from .tools.confluence_tools import get_confluence_tools
 
 
 class QAState(TypedDict):
@@ -37,9 +37,9 @@ class QAWorkflow:
             llm: Language model to use for reasoning
             use_mock: Whether to use mock APIs
         """
-        self.github_tools = GitHubTools(use_mock=use_mock)
-        self.jira_tools = JiraTools(use_mock=use_mock)
-        self.confluence_tools = ConfluenceTools(use_mock=use_mock)
+        self.github_tools = get_github_tools(use_mock=use_mock)
+        self.jira_tools = get_jira_tools(use_mock=use_mock)
+        self.confluence_tools = get_confluence_tools(use_mock=use_mock)
         
         # Combine all tools
         self.tools = []
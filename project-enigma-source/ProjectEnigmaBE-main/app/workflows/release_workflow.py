@@ -7,20 +7,550 @@ and Confluence documentation generation.
 """
 
 import asyncio
+import hashlib
+import json
+import logging
 import re
-from typing import Any, Dict, List, TypedDict
-
+import weakref
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from string import Template
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    TypeVar,
+)
+
+from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 
-from langgraph.checkpoint.memory import MemorySaver
-
 from app.core.config import get_settings
-from app.integrations.factory import APIClientFactory
+from app.core.logging_utils import LogLevel, log_workflow_function
+from app.integrations.exceptions import (
+    AuthenticationError,
+    ConfluencePageNotFoundError,
+    GitHubAuthenticationError,
+)
+from app.integrations.factory import get_api_clients
 from app.models.api import ChatRequest
-from app.core.logging_utils import log_workflow_function, LogLevel
+
+logger = logging.getLogger(__name__)
+
+_SEMVER_RE = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)")
+
+# Speculative branch listings started alongside JIRA collection, keyed by workflow_id.
+# Tasks are not serializable, so they live here rather than in the workflow state.
+_branch_prefetches: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+# Confluence page lookups started alongside rollback preparation, keyed by workflow_id
+_doc_page_prefetches: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+
+# GitHub concurrency limit, one semaphore per event loop
+_github_semaphores: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_T = TypeVar("_T")
+
+# Rendered deployment documentation, keyed by a digest of the state it is built from
+_DOC_CACHE_SIZE = 32
+_DOC_INPUT_KEYS = (
+    "fix_version",
+    "sprint_name",
+    "release_type",
+    "repositories",
+    "jira_tickets",
+    "pull_requests",
+    "release_branches",
+    "rollback_branches",
+    "calculated_version",
+)
+_doc_cache: "OrderedDict[str, str]" = OrderedDict()
+# Stands in for the generation time in cached documentation; escaped values never
+# contain "<", so the marker cannot collide with rendered content
+_DOC_TIMESTAMP_MARKER = "<!--generated-at-->"
+
+# Deployment documentation fragments, parsed once; substituted values are HTML-escaped
+_DOC_HEADER = Template(
+    """
+<h1>Release $fix_version - Deployment Documentation</h1>
+
+<h2>Release Information</h2>
+<table>
+    <tr><td><strong>Fix Version:</strong></td><td>$fix_version</td></tr>
+    <tr><td><strong>Sprint:</strong></td><td>$sprint_name</td></tr>
+    <tr><td><strong>Release Type:</strong></td><td>$release_type</td></tr>
+    <tr><td><strong>Version:</strong></td><td>$calculated_version</td></tr>
+    <tr><td><strong>Generated:</strong></td><td>$timestamp</td></tr>
+    <tr><td><strong>Repositories:</strong></td><td>$repository_count</td></tr>
+</table>
+
+<h2>JIRA Tickets Included</h2>
+<table>
+    <thead>
+        <tr>
+            <th>JIRA ID</th>
+            <th>Summary</th>
+            <th>Status</th>
+            <th>Assignee</th>
+        </tr>
+    </thead>
+    <tbody>
+"""
+)
+_DOC_TICKET_ROW = Template(
+    """
+        <tr>
+            <td><a href="https://your-company.atlassian.net/browse/$key">$key</a></td>
+            <td>$summary</td>
+            <td>$status</td>
+            <td>$assignee</td>
+        </tr>
+"""
+)
+_DOC_NO_TICKETS = """
+        <tr><td colspan="4">No JIRA tickets found</td></tr>
+"""
+_DOC_DEPLOYMENT_HEADER = """
+    </tbody>
+</table>
+
+<h2>Deployment Plan</h2>
+<p>Execute deployment in the following order:</p>
+"""
+_DOC_DEPLOYMENT_SECTION = Template(
+    """
+<h4>$repo</h4>
+<ul>
+    <li><strong>Jenkins Job:</strong> <a href="https://jenkins.your-company.com/job/$repo/job/$branch/build">$repo - $branch</a></li>
+    <li><strong>Pull Request:</strong> $pr_link</li>
+    <li><strong>Branch:</strong> $branch</li>
+    <li><strong>Version:</strong> $calculated_version</li>
+</ul>
+"""
+)
+_DOC_PR_LINK = Template('<a href="$url">$title</a>')
+_DOC_ROLLBACK_HEADER = """
+<h2>Rollback Plan</h2>
+<p><strong>⚠️ Emergency Rollback Procedures:</strong></p>
+<p>In case of deployment issues, follow these steps for each repository:</p>
+"""
+_DOC_ROLLBACK_SECTION = Template(
+    """
+<h4>$repo</h4>
+<ul>
+    <li><strong>Rollback Branch:</strong> $rollback_branch</li>
+    <li><strong>Emergency Jenkins Job:</strong> <a href="https://jenkins.your-company.com/job/$repo/job/$jenkins_branch/build">$repo - Rollback</a></li>
+    <li><strong>Rollback Command:</strong> <code>git checkout $rollback_branch</code></li>
+</ul>
+"""
+)
+_DOC_FOOTER = """
+<h2>Deployment Checklist</h2>
+<ul>
+    <li>☐ All JIRA tickets are in "Done" status</li>
+    <li>☐ All feature branches merged to sprint branch</li>
+    <li>☐ Sprint branches merged to develop</li>
+    <li>☐ Release branches created and tagged</li>
+    <li>☐ Pull requests reviewed and approved</li>
+    <li>☐ Rollback branches prepared</li>
+    <li>☐ Jenkins jobs configured and tested</li>
+    <li>☐ Stakeholders notified of deployment window</li>
+</ul>
+
+<h2>Emergency Contacts</h2>
+<ul>
+    <li><strong>Release Manager:</strong> TBD</li>
+    <li><strong>DevOps Engineer:</strong> TBD</li>
+    <li><strong>On-Call Developer:</strong> TBD</li>
+</ul>
+
+<p><em>Generated automatically by Project Enigma Release Automation</em></p>
+"""
+
+# Conversation messages kept in workflow state; older ones remain only in the logs
+_MAX_MESSAGES = 500
+
+# Error text that means the GitHub token itself is unusable, not just one call
+_GITHUB_AUTH_ERROR_MARKERS = ("bad credentials",)
+
+# Release steps in execution order; each routes to the next, the last to "complete"
+_PIPELINE = (
+    "start",
+    "jira_collection",
+    "branch_discovery",
+    "merge_validation",
+    "sprint_merging",
+    "release_creation",
+    "pr_generation",
+    "release_tagging",
+    "rollback_preparation",
+    "documentation",
+)
+
+# Workflow routing: step -> next step
+_STEP_FLOW = MappingProxyType(
+    {
+        **dict(zip(_PIPELINE, (*_PIPELINE[1:], "complete"))),
+        "error": "error_handler",
+        "error_handler": "error_handler",  # Allow error handler to route to itself
+    }
+)
+
+
+@dataclass(slots=True)
+class RepoMergeResult:
+    """Outcome of merging the sprint branch into develop for one repository."""
+
+    status: str
+    pr_url: str
+    pr_number: int
+    merge_sha: Optional[str] = None
+    error: Optional[str] = None
+
+
+# Rollback branch statuses and base, shared by every per-repository result
+_ROLLBACK_CREATED = "created"
+_ROLLBACK_EXISTS = "exists"
+_ROLLBACK_BASE = "master"
+
+
+@dataclass(slots=True, frozen=True)
+class RollbackResult:
+    """Outcome of preparing the rollback branch for one repository."""
+
+    status: str
+    branch: str
+    base: str = _ROLLBACK_BASE
+    sha: Optional[str] = None
+
+
+def _github_semaphore() -> asyncio.Semaphore:
+    """Return the GitHub concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _github_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, get_settings().github_concurrency))
+        _github_semaphores[loop] = semaphore
+    return semaphore
+
+
+@asynccontextmanager
+async def _github_slot():
+    """Hold one of the shared GitHub slots; the client paces each request."""
+    async with _github_semaphore():
+        yield
+
+
+async def _github_bounded(awaitable: Awaitable[_T]) -> _T:
+    """Await a GitHub operation while holding a concurrency slot."""
+    async with _github_slot():
+        return await awaitable
+
+
+def _ensure_github_available(state: "WorkflowState") -> None:
+    """Fail fast with the recorded auth failure instead of calling GitHub again."""
+    failure = state.get("github_auth_failure")
+    if failure:
+        raise GitHubAuthenticationError(failure)
+
+
+def _record_github_error(state: "WorkflowState", error: Exception) -> None:
+    """Remember token-wide auth failures so later repositories skip the API.
+
+    Permission errors are per repository and are not latched.
+    """
+    if isinstance(error, AuthenticationError) or any(
+        marker in str(error).casefold() for marker in _GITHUB_AUTH_ERROR_MARKERS
+    ):
+        state["github_auth_failure"] = str(error)
+
+
+async def _fetch_branch_names(github_client, repositories: List[str]) -> Dict[str, Any]:
+    """Fetch branch names for all repositories; failures are kept per repository."""
+    results = await asyncio.gather(
+        *(_github_bounded(github_client.get_branches(repo)) for repo in repositories),
+        return_exceptions=True,
+    )
+    return {
+        repo: (
+            result
+            if isinstance(result, BaseException)
+            else frozenset(branch.name for branch in result)
+        )
+        for repo, result in zip(repositories, results)
+    }
+
+
+def _start_branch_prefetch(state: "WorkflowState") -> None:
+    """Start listing branches in the background while JIRA tickets are collected."""
+    workflow_id = state.get("workflow_id")
+    repositories = list(state.get("repositories") or [])
+    if not workflow_id or not repositories:
+        return
+
+    _discard_branch_prefetch(state)
+    _branch_prefetches[workflow_id] = asyncio.create_task(
+        _fetch_branch_names(get_api_clients().github, repositories)
+    )
+
+
+def _cancel_task(task: "asyncio.Task[Any]") -> None:
+    """Cancel a task from any thread; cancel() is only safe on the task's own loop."""
+    loop = task.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        task.cancel()
+    elif not loop.is_closed():
+        loop.call_soon_threadsafe(task.cancel)
+
+
+async def _take_branch_prefetch(state: "WorkflowState") -> Dict[str, Any]:
+    """Return prefetched branch names for this workflow, or an empty dict."""
+    task = _branch_prefetches.pop(state.get("workflow_id"), None)
+    if task is None:
+        return {}
+    if task.get_loop() is not asyncio.get_running_loop():
+        # Started on another loop and cannot be awaited here
+        _cancel_task(task)
+        return {}
+    try:
+        return await task
+    except Exception:
+        return {}
+
+
+def _discard_branch_prefetch(state: "WorkflowState") -> None:
+    """Cancel any unused branch prefetch for this workflow."""
+    task = _branch_prefetches.pop(state.get("workflow_id"), None)
+    if task is not None:
+        _cancel_task(task)
+
+
+def _doc_title(state: "WorkflowState") -> str:
+    """Return the Confluence title of the release's deployment documentation."""
+    return f"Release {state['fix_version']} - Deployment Documentation"
+
+
+def _page_entry(page: Any) -> Dict[str, Any]:
+    """Reduce a ConfluencePage to the id/ETag/version kept in the page cache."""
+    return {"id": page.id, "etag": page.etag, "version": page.version}
+
+
+async def _lookup_doc_page(
+    confluence_client, space_key: str, title: str, cached: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Find the documentation page, revalidating the cached entry before searching."""
+    if cached:
+        # Conditional GET; a 304 confirms the cached entry without a search
+        try:
+            fresh_page = await confluence_client.get_page_if_modified(
+                cached["id"], cached.get("etag")
+            )
+        except ConfluencePageNotFoundError:
+            pass
+        else:
+            return cached if fresh_page is None else _page_entry(fresh_page)
+
+    existing_pages = await confluence_client.search_pages(
+        space_key=space_key, title=title, include_content=False
+    )
+    return _page_entry(existing_pages[0]) if existing_pages else None
+
+
+def _start_doc_page_prefetch(state: "WorkflowState") -> None:
+    """Start looking up the documentation page while rollback branches are prepared."""
+    workflow_id = state.get("workflow_id")
+    if not workflow_id or not state.get("fix_version"):
+        return
+
+    title = _doc_title(state)
+    _discard_doc_page_prefetch(state)
+    _doc_page_prefetches[workflow_id] = asyncio.create_task(
+        _lookup_doc_page(
+            get_api_clients().confluence,
+            get_settings().confluence_space_key,
+            title,
+            (state.get("confluence_page_cache") or {}).get(title),
+        )
+    )
+
+
+def _take_doc_page_prefetch(
+    state: "WorkflowState",
+) -> "Optional[asyncio.Task[Optional[Dict[str, Any]]]]":
+    """Return this workflow's pending page lookup if it can be awaited here."""
+    task = _doc_page_prefetches.pop(state.get("workflow_id"), None)
+    if task is None:
+        return None
+    if task.get_loop() is not asyncio.get_running_loop():
+        _cancel_task(task)
+        return None
+    return task
+
+
+def _discard_doc_page_prefetch(state: "WorkflowState") -> None:
+    """Cancel any unused documentation page lookup for this workflow."""
+    task = _doc_page_prefetches.pop(state.get("workflow_id"), None)
+    if task is not None:
+        _cancel_task(task)
+
+
+async def _emit_progress(step: str, message: AIMessage) -> None:
+    """Publish an intermediate status message to astream_events consumers."""
+    try:
+        await adispatch_custom_event(
+            "workflow_progress", {"step": step, "content": message.content}
+        )
+    except RuntimeError:
+        # Not running inside a graph/runnable context
+        pass
+
+
+async def _stream_repo_outcomes(
+    step: str, workers: List[Awaitable[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Run per-repository workers concurrently, streaming each one's messages."""
+
+    async def _indexed(index: int, worker: Awaitable[Dict[str, Any]]):
+        return index, await _github_bounded(worker)
+
+    tasks = [
+        asyncio.ensure_future(_indexed(index, worker))
+        for index, worker in enumerate(workers)
+    ]
+    # Messages stream in completion order; outcomes keep input order for state
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, outcome = await next_done
+            outcomes[index] = outcome
+            for message in outcome["messages"]:
+                await _emit_progress(step, message)
+    finally:
+        # Only matters when a worker raised; finished tasks ignore cancel()
+        for task in tasks:
+            task.cancel()
+    return outcomes
+
+
+async def _discover_stream(
+    github_client,
+    repositories: List[str],
+    ticket_ids: List[str],
+    prefetched_branches: Dict[str, Any],
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield ("msg", AIMessage) and ("result", (repo, found, missing)) per repo."""
+    feature_patterns = [(ticket_id, f"feature/{ticket_id}") for ticket_id in ticket_ids]
+
+    for repo in repositories:
+        repo_branches = []
+        repo_missing = []
+
+        try:
+            # Get all branches for the repository
+            branch_names = prefetched_branches.get(repo)
+            if isinstance(branch_names, BaseException):
+                raise branch_names
+            if branch_names is None:
+                branches = await github_client.get_branches(repo)
+                branch_names = frozenset(branch.name for branch in branches)
+
+            # Look for feature branches matching pattern: feature/{JIRA-ID}
+            for ticket_id, feature_pattern in feature_patterns:
+                if feature_pattern in branch_names:
+                    repo_branches.append(feature_pattern)
+                else:
+                    repo_missing.append(ticket_id)
+
+            yield "result", (repo, repo_branches, repo_missing)
+
+            # Report findings for this repository
+            found_count = len(repo_branches)
+            missing_count = len(repo_missing)
+
+            branch_status = (
+                f"  📁 {repo}: {found_count} found, {missing_count} missing\n"
+            )
+            for branch in repo_branches:
+                branch_status += f"    ✅ {branch}\n"
+            for missing in repo_missing:
+                branch_status += f"    ❌ feature/{missing} - not found\n"
+
+            yield "msg", AIMessage(content=branch_status)
+
+        except Exception as api_error:
+            # Fall back to mock data for this repository
+            yield "msg", AIMessage(
+                content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
+                f"  🔧 Using mock data for {repo}...\n"
+            )
+
+            # Mock data fallback
+            mock_branches = [
+                f"feature/{ticket_id}" for ticket_id in ticket_ids[:2]
+            ]  # First 2 tickets
+            mock_missing = ticket_ids[2:]  # Remaining tickets
+
+            yield "result", (repo, mock_branches, mock_missing)
+
+            mock_status = f"  📁 {repo} (mock):\n"
+            for branch in mock_branches:
+                mock_status += f"    ✅ {branch}\n"
+            for missing in mock_missing:
+                mock_status += f"    ❌ feature/{missing} - not found\n"
+
+            yield "msg", AIMessage(content=mock_status)
+
+
+def _completed_steps(state: "WorkflowState") -> Set[str]:
+    """Return completed steps as a set, rebuilding it from the list if stale."""
+    steps_completed = state.get("steps_completed")
+    if steps_completed is None:
+        steps_completed = state["steps_completed"] = []
+    completed = state.get("steps_completed_set")
+    if not isinstance(completed, set) or len(completed) != len(steps_completed):
+        completed = set(steps_completed)
+        state["steps_completed_set"] = completed
+    return completed
+
+
+def _mark_step_completed(state: "WorkflowState", step_name: str) -> None:
+    """Record a completed step once, keeping the list and lookup set in sync."""
+    completed = _completed_steps(state)
+    if step_name not in completed:
+        state["steps_completed"].append(step_name)
+        completed.add(step_name)
+
+
+def _append_messages(state: "WorkflowState", messages: List[BaseMessage]) -> None:
+    """Append messages to the state, keeping only the most recent _MAX_MESSAGES."""
+    combined = add_messages(state["messages"], messages)
+    if len(combined) > _MAX_MESSAGES:
+        combined = combined[-_MAX_MESSAGES:]
+    state["messages"] = combined
 
 
 def check_step_completion(state: "WorkflowState", step_name: str, step_title: str) -> bool:
@@ -35,59 +565,113 @@ def check_step_completion(state: "WorkflowState", step_name: str, step_title: st
     Returns:
         True if step is already completed, False otherwise
     """
-    if step_name in state.get("steps_completed", []):
-        from langchain_core.messages import AIMessage
-        from langgraph.graph.message import add_messages
-        
-        resume_msg = AIMessage(
-            content=f"🔄 **{step_title} (Resumed)**\n"
-            f"Step already completed. Skipping execution.\n\n"
-        )
-        state["messages"] = add_messages(state["messages"], [resume_msg])
+    if step_name in _completed_steps(state):
+        # Announce each skipped step once, however many times the run resumes
+        resumed_steps = state.setdefault("resumed_steps", [])
+        if step_name not in resumed_steps:
+            resumed_steps.append(step_name)
+            resume_msg = AIMessage(
+                content=f"🔄 **{step_title} (Resumed)**\n"
+                f"Step already completed. Skipping execution.\n\n"
+            )
+            _append_messages(state, [resume_msg])
         return True
     return False
 
 
+async def _get_version_tag_names(
+    github_client, state: "WorkflowState", repo: str
+) -> List[str]:
+    """Return version tag names for a repository, fetched at most once per run."""
+    tag_cache = state.setdefault("tag_cache", {})
+    if repo not in tag_cache:
+        tags = await github_client.get_tags(repo)
+        # Only version tags matter here; keep the checkpointed cache small
+        tag_cache[repo] = [tag.name for tag in tags if _SEMVER_RE.match(tag.name)]
+    return tag_cache[repo]
+
+
+async def _get_branch_names(
+    github_client, state: "WorkflowState", repo: str
+) -> Set[str]:
+    """Return a repository's branch names, fetched at most once per run."""
+    branch_cache = state.setdefault("branch_cache", {})
+    names = branch_cache.get(repo)
+    if not isinstance(names, set):
+        branches = await github_client.get_branches(repo)
+        names = branch_cache[repo] = {branch.name for branch in branches}
+    return names
+
+
+async def _branches_exist(
+    github_client, state: "WorkflowState", pairs: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], bool]:
+    """Resolve branch existence from the cache, batching any misses into one call."""
+    branch_cache = state.get("branch_cache") or {}
+    existing: Dict[Tuple[str, str], bool] = {}
+    misses: List[Tuple[str, str]] = []
+    for repo, branch_name in pairs:
+        names = branch_cache.get(repo)
+        if isinstance(names, set):
+            existing[(repo, branch_name)] = branch_name in names
+        else:
+            misses.append((repo, branch_name))
+
+    if misses and not state.get("github_auth_failure"):
+        try:
+            existing.update(
+                await _github_bounded(github_client.bulk_branch_exists(misses))
+            )
+        except Exception as e:
+            # Unresolved pairs fall back to per-repository branch listings
+            logger.debug("Bulk branch lookup failed: %s", e)
+    return existing
+
+
+def _remember_branch(state: "WorkflowState", repo: str, branch_name: str) -> None:
+    """Record a newly created branch in the cached branch set, if one exists."""
+    names = (state.get("branch_cache") or {}).get(repo)
+    if isinstance(names, set):
+        names.add(branch_name)
+
+
 async def _calculate_next_version(github_client, state: "WorkflowState") -> str:
     """Calculate the next semantic version based on existing tags."""
+    # Reuse the version from an earlier pass (resume or retry of this step)
+    if state.get("calculated_version"):
+        return state["calculated_version"]
+
     try:
         # Use the provided fix version if it follows semantic versioning
         fix_version = state.get("fix_version", "")
 
         # If fix version already looks like semantic version, use it
-        if re.match(r"^v?\d+\.\d+\.\d+", fix_version):
+        if _SEMVER_RE.match(fix_version):
             return fix_version if fix_version.startswith("v") else f"v{fix_version}"
 
         # Otherwise, try to get latest version from any repository
-        latest_version = "v0.0.0"
-
-        for repo in state.get("repositories", []):
-            try:
-                tags = await github_client.get_tags(repo)
-
-                # Filter semantic version tags
-                version_tags = []
-                for tag in tags:
-                    if re.match(r"^v?\d+\.\d+\.\d+", tag.name):
-                        version_tags.append(tag.name)
-
-                if version_tags:
-                    # Sort versions and get the latest
-                    version_tags.sort(key=lambda v: _version_sort_key(v), reverse=True)
-                    repo_latest = version_tags[0]
-
-                    if _version_sort_key(repo_latest) > _version_sort_key(
-                        latest_version
-                    ):
-                        latest_version = repo_latest
+        repo_tags = await asyncio.gather(
+            *(
+                _github_bounded(_get_version_tag_names(github_client, state, repo))
+                for repo in state.get("repositories", [])
+            ),
+            return_exceptions=True,
+        )
 
-            except Exception:
-                # Skip repository if we can't get tags
-                continue
+        # Latest semantic version tag across repositories, skipping failed fetches
+        latest_version = max(
+            (
+                name
+                for tag_names in repo_tags
+                if not isinstance(tag_names, BaseException)
+                for name in tag_names
+            ),
+            key=_version_sort_key,
+            default="v0.0.0",
+        )
 
         # Increment major version for new release
-        version_parts = latest_version.replace("v", "").split(".")
-        major = int(version_parts[0]) + 1
+        major = _version_sort_key(latest_version)[0] + 1
         minor = 0
         patch = 0
 
@@ -99,11 +683,35 @@ async def _calculate_next_version(github_client, state: "WorkflowState") -> str:
         return fix_version if fix_version.startswith("v") else f"v{fix_version}"
 
 
+@lru_cache(maxsize=4096)
 def _version_sort_key(version: str) -> tuple:
     """Create sort key for semantic version."""
-    version = version.replace("v", "")
-    parts = version.split(".")
-    return tuple(int(part) for part in parts[:3])
+    match = _SEMVER_RE.match(version)
+    if match is None:
+        return (0, 0, 0)
+    return (int(match[1]), int(match[2]), int(match[3]))
+
+
+def _ticket_key(jira_tickets: List[Dict[str, Any]]) -> tuple:
+    """Build a hashable (id, summary, status) key for a list of tickets."""
+    return tuple(
+        (ticket["id"], ticket["summary"], ticket["status"]) for ticket in jira_tickets
+    )
+
+
+@lru_cache(maxsize=32)
+def _format_ticket_lines(
+    tickets: tuple, bullet: str = "-", bold: bool = False
+) -> tuple:
+    """Format ticket bullet lines for PR descriptions and tag messages."""
+    if bold:
+        return tuple(
+            f"{bullet} **{ticket_id}**: {summary} [{status}]\n"
+            for ticket_id, summary, status in tickets
+        )
+    return tuple(
+        f"{bullet} {ticket_id}: {summary}\n" for ticket_id, summary, _ in tickets
+    )
 
 
 def _generate_pr_description(state: "WorkflowState", version: str) -> str:
@@ -112,7 +720,8 @@ def _generate_pr_description(state: "WorkflowState", version: str) -> str:
     sprint_name = state.get("sprint_name", "")
     release_type = state.get("release_type", "release")
 
-    description = f"""# Release {version}
+    parts = [
+        f"""# Release {version}
 
 **Release Type:** {release_type.title()}
 **Sprint:** {sprint_name}
@@ -121,16 +730,15 @@ def _generate_pr_description(state: "WorkflowState", version: str) -> str:
 ## 📋 Included Changes
 
 """
+    ]
 
     if jira_tickets:
-        for ticket in jira_tickets:
-            description += (
-                f"- **{ticket['id']}**: {ticket['summary']} [{ticket['status']}]\n"
-            )
+        parts.extend(_format_ticket_lines(_ticket_key(jira_tickets), bold=True))
     else:
-        description += "- No JIRA tickets specified\n"
+        parts.append("- No JIRA tickets specified\n")
 
-    description += f"""
+    parts.append(
+        f"""
 
 ## 🚀 Deployment Instructions
 
@@ -155,18 +763,20 @@ Rollback branches have been created from master for quick reversion if needed:
 ## 📊 Repository Status
 
 """
+    )
 
     repositories = state.get("repositories", [])
-    for repo in repositories:
-        description += f"- {repo}: Ready for deployment\n"
+    parts.extend(f"- {repo}: Ready for deployment\n" for repo in repositories)
 
-    description += f"""
+    parts.append(
+        """
 
 ---
 *This release was automated by Project Enigma workflow engine.*
 """
+    )
 
-    return description
+    return "".join(parts)
 
 
 def _generate_tag_message(state: "WorkflowState", version: str) -> str:
@@ -175,119 +785,134 @@ def _generate_tag_message(state: "WorkflowState", version: str) -> str:
     sprint_name = state.get("sprint_name", "")
     release_type = state.get("release_type", "release")
 
-    message = f"Release {version}\n\n"
-    message += f"Release Type: {release_type.title()}\n"
-    message += f"Sprint: {sprint_name}\n"
-    message += f"Fix Version: {state.get('fix_version', '')}\n\n"
+    parts = [
+        f"Release {version}\n\n",
+        f"Release Type: {release_type.title()}\n",
+        f"Sprint: {sprint_name}\n",
+        f"Fix Version: {state.get('fix_version', '')}\n\n",
+    ]
 
     if jira_tickets:
-        message += "Included Changes:\n"
-        for ticket in jira_tickets:
-            message += f"- {ticket['id']}: {ticket['summary']}\n"
+        parts.append("Included Changes:\n")
+        parts.extend(_format_ticket_lines(_ticket_key(jira_tickets)))
+    else:
+        parts.append("No specific JIRA tickets included.\n")
+
+    parts.append("\nAutomated by Project Enigma workflow engine")
+
+    return "".join(parts)
+
+
+def _documentation_key(state: "WorkflowState") -> str:
+    """Digest the workflow state that the deployment documentation depends on."""
+    inputs = {key: state.get(key) for key in _DOC_INPUT_KEYS}
+    payload = json.dumps(inputs, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cached_documentation(
+    state: "WorkflowState", render: Callable[["WorkflowState"], str]
+) -> Tuple[str, str]:
+    """Return (key, content) for the documentation, rendering it only on a miss."""
+    key = _documentation_key(state)
+    content = _doc_cache.get(key)
+    if content is None:
+        content = _doc_cache[key] = render(state)
+        if len(_doc_cache) > _DOC_CACHE_SIZE:
+            _doc_cache.popitem(last=False)
     else:
-        message += "No specific JIRA tickets included.\n"
+        _doc_cache.move_to_end(key)
+    return key, content
 
-    message += f"\nAutomated by Project Enigma workflow engine"
 
-    return message
+def _stamp_documentation(content: str) -> str:
+    """Fill the current time into cached documentation just before it is uploaded."""
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    return content.replace(_DOC_TIMESTAMP_MARKER, timestamp, 1)
+
+
+def _state_summary(state: "WorkflowState") -> Dict[str, Any]:
+    """Return the state keys worth logging without dumping the full conversation."""
+    return {
+        "current_step": state.get("current_step"),
+        "steps_completed": state.get("steps_completed"),
+        "messages": len(state.get("messages") or ()),
+        "error": state.get("error"),
+    }
 
 
 def handle_workflow_error(
     state: "WorkflowState", step: str, error: str
 ) -> "WorkflowState":
     """Handle workflow errors with recovery options."""
-    print(f"\n\n[DEBUG] handle_workflow_error called\n")
-    print(f"[DEBUG] step: {step}")
-    print(f"[DEBUG] error: {error}")
-    print(f"[DEBUG] state before error handling: {state}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "handle_workflow_error step=%s error=%s state=%s",
+            step,
+            error,
+            _state_summary(state),
+        )
 
     state["error"] = error
     state["error_step"] = step
     state["current_step"] = "error"
+    # A failed run may never reach complete_workflow; drop background lookups now
+    _discard_branch_prefetch(state)
+    _discard_doc_page_prefetch(state)
     state["can_continue"] = True  # Allow recovery attempts
     state["steps_failed"].append(step)
 
     # Ensure messages key exists
     if "messages" not in state:
-        print("[DEBUG] 'messages' key not found in state, initializing as empty list.")
         state["messages"] = []
 
     error_msg = AIMessage(
         content=f"❌ **Error in {step}:**\n{error}\n\n"
         f"🔄 The workflow can be resumed after resolving the issue.\n\n"
     )
-    print(f"[DEBUG] Adding error message to state['messages']")
-    state["messages"] = add_messages(state["messages"], [error_msg])
+    _append_messages(state, [error_msg])
 
-    print(f"[DEBUG] state after error handling: {state}")
     return state
 
 
 def should_continue_workflow(state: "WorkflowState") -> str:
     """Determine the next step based on workflow state."""
-    current_step = state.get("current_step", "")
-    print(f"\n\n[DEBUG] should_continue_workflow called\n")
-    print(f"[DEBUG] current_step: {current_step}")
-    print(f"[DEBUG] state: {state}")
-
-    # Define the workflow flow
-    step_flow = {
-        "start": "jira_collection",
-        "jira_collection": "branch_discovery",
-        "branch_discovery": "merge_validation",
-        "merge_validation": "sprint_merging",
-        "sprint_merging": "release_creation",
-        "release_creation": "pr_generation",
-        "pr_generation": "release_tagging",
-        "release_tagging": "rollback_preparation",
-        "rollback_preparation": "documentation",
-        "documentation": "complete",
-        "error": "error_handler",
-        "error_handler": "error_handler",  # Allow error handler to route to itself
-    }
-    
+    get = state.get
+    current_step = get("current_step", "")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("should_continue_workflow state=%s", _state_summary(state))
+
     # Handle empty or missing current_step
-    if not current_step or current_step == "":
-        print("[DEBUG] Current step is empty or missing. Starting from 'start'.")
+    if not current_step:
         return "start"
-    
+
     # Handle paused workflows - stay at current step
-    if state.get("workflow_paused"):
-        print("[DEBUG] Workflow is paused.")
-        result = current_step if current_step else "error_handler"
-        print(f"[DEBUG] Returning: {result}")
-        return result
-    
+    if get("workflow_paused"):
+        return current_step
+
     # Handle error states first
-    if state.get("error") and not state.get("can_continue"):
-        print("[DEBUG] Error present and cannot continue. Routing to error_handler.")
+    if get("error") and not get("can_continue"):
         return "error_handler"
 
     # Handle completion
-    if state.get("workflow_complete"):
-        print("[DEBUG] Workflow is complete. Routing to 'complete'.")
+    if get("workflow_complete"):
         return "complete"
 
-    # Handle resuming from a specific step
-    if current_step and current_step in step_flow:
-        steps_completed = state.get("steps_completed", [])
-        print(f"[DEBUG] steps_completed: {steps_completed}")
-        if current_step in steps_completed:
-            next_step = step_flow.get(current_step, "complete")
-            print(f"[DEBUG] Current step '{current_step}' already completed. Routing to next step: {next_step}")
-            return next_step
-        else:
-            print(f"[DEBUG] Resuming from current step: {current_step}")
-            return current_step
+    next_step = _STEP_FLOW.get(current_step)
 
     # Handle unknown states
-    if current_step not in step_flow:
-        print(f"[DEBUG] Current step '{current_step}' not in step_flow. Routing to error_handler.")
+    if next_step is None:
+        logger.debug("Unknown step %s, routing to error_handler", current_step)
         return "error_handler"
 
-    result = step_flow.get(current_step, "complete")
-    print(f"[DEBUG] Default routing to: {result}")
-    return result
+    # Handle resuming from a specific step
+    if current_step in _completed_steps(state):
+        logger.debug(
+            "Step %s already completed, routing to %s", current_step, next_step
+        )
+        return next_step
+    return current_step
+
 
 class WorkflowState(TypedDict):
     """Enhanced state object for the release workflow with persistence support."""
@@ -313,6 +938,14 @@ class WorkflowState(TypedDict):
     release_branches: List[str]
     rollback_branches: List[str]
     confluence_url: str
+    calculated_version: str
+    github_auth_failure: str
+    doc_cache_key: str
+    doc_page_version: int
+    confluence_page_cache: Dict[str, Dict[str, Any]]
+    confluence_content_hash: str
+    tag_cache: Dict[str, List[str]]
+    branch_cache: Dict[str, Set[str]]
 
     # Error handling and recovery
     error: str
@@ -322,20 +955,20 @@ class WorkflowState(TypedDict):
 
     # Progress tracking
     steps_completed: List[str]
+    steps_completed_set: Set[str]
+    resumed_steps: List[str]
     steps_failed: List[str]
 
 
 
 
-def create_release_workflow() -> StateGraph:
-    """Create and configure the release automation workflow."""
+@lru_cache(maxsize=1)
+def _build_release_graph() -> StateGraph:
+    """Build the release workflow graph once; each caller compiles its own copy."""
 
     @log_workflow_function(level=LogLevel.INFO, include_state=True, include_result=False, include_execution_time=True, log_errors=True)
     async def start_workflow(state: WorkflowState) -> WorkflowState:
         """Initialize the workflow with user input."""
-        print(f"\n\n[DEBUG] start_workflow called\n")
-        print(f"[DEBUG] Initial state: {state}")
-
         try:
             # Check if this is a fresh start or a resume
             is_resume = state.get("workflow_id") and (
@@ -343,15 +976,16 @@ def create_release_workflow() -> StateGraph:
                 # state.get("current_step") != "start" or
                 state.get("workflow_complete") is True
             )
-            print(f"[DEBUG] state: {state}")
-            print(f"[DEBUG] state.get('workflow_id'): {state.get('workflow_id')}")
-            print(f"[DEBUG] state.get('steps_completed'): {state.get('steps_completed')}")
-            print(f"[DEBUG] state.get('current_step'): {state.get('current_step')}")
-            print(f"[DEBUG] state.get('workflow_complete'): {state.get('workflow_complete')}")
-            print(f"[DEBUG] is_resume: {is_resume}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "start_workflow is_resume=%s state=%s",
+                    bool(is_resume),
+                    _state_summary(state),
+                )
+
+            pending_msgs: List[AIMessage] = []
 
             if not is_resume:
-                print("[DEBUG] Fresh start detected. Initializing state variables.")
                 # Fresh start - initialize all state variables
                 state["current_step"] = "start"
                 state["workflow_complete"] = False
@@ -361,26 +995,24 @@ def create_release_workflow() -> StateGraph:
                 state["retry_count"] = 0
                 state["can_continue"] = True
                 state["steps_completed"] = []
+                state["steps_completed_set"] = set()
+                state["resumed_steps"] = []
+                state["github_auth_failure"] = ""
                 state["steps_failed"] = []
 
                 # Generate workflow ID if not present
                 if not state.get("workflow_id"):
                     import uuid
                     state["workflow_id"] = str(uuid.uuid4())
-                    print(f"[DEBUG] Generated new workflow_id: {state['workflow_id']}")
-                else:
-                    print(f"[DEBUG] Using provided workflow_id: {state['workflow_id']}")
 
                 # Add initial message for fresh start
                 ai_msg = AIMessage(content="🚀 Starting release automation workflow...\n\n")
-                state["messages"] = add_messages(state["messages"], [ai_msg])
-                print(f"[DEBUG] Added initial AIMessage to messages.")
+                pending_msgs.append(ai_msg)
 
                 # Extract workflow parameters
                 repositories = state.get("repositories", [])
                 fix_version = state.get("fix_version", "v2.1.0")
                 sprint_name = state.get("sprint_name", "sprint-2024-01")
-                print(f"[DEBUG] Workflow parameters - repositories: {repositories}, fix_version: {fix_version}, sprint_name: {sprint_name}")
 
                 config_msg = AIMessage(
                     content=f"📋 **Release Configuration:**\n"
@@ -389,50 +1021,44 @@ def create_release_workflow() -> StateGraph:
                     f"- Sprint Branch: {sprint_name}\n"
                     f"- Target Repositories: {', '.join(repositories)}\n\n"
                 )
-                state["messages"] = add_messages(state["messages"], [config_msg])
-                print(f"[DEBUG] Added config AIMessage to messages.")
+                pending_msgs.append(config_msg)
 
-                state["steps_completed"].append("start")
-                print(f"[DEBUG] Appended 'start' to steps_completed: {state['steps_completed']}")
+                _mark_step_completed(state, "start")
             else:
-                print("[DEBUG] Resume detected. Preserving existing state and adding resume message.")
                 # Resume - preserve existing state and add resume message
                 # Ensure messages key exists
                 if "messages" not in state:
                     state["messages"] = []
-                    print("[DEBUG] 'messages' key not found in state. Initialized to empty list.")
                 
                 resume_msg = AIMessage(content="🔄 Resuming release automation workflow...\n\n")
-                state["messages"] = add_messages(state["messages"], [resume_msg])
-                print(f"[DEBUG] Added resume AIMessage to messages.")
+                pending_msgs.append(resume_msg)
                 
                 # Clear any previous errors when resuming
                 state["error"] = ""
                 state["error_step"] = ""
+                state["github_auth_failure"] = ""
                 state["can_continue"] = True
                 state["workflow_paused"] = False
-                if not state["steps_completed"]:
-                    state["steps_completed"]= ["start"]
-                if state["steps_completed"] and "start" not in state["steps_completed"]:
-                    state["steps_completed"].append("start")
+                _mark_step_completed(state, "start")
 
                 # Ensure current_step is set properly for resume
                 if not state.get("current_step") or state["current_step"] == "":
                     # If no current step, start from the beginning
                     state["current_step"] = "start"
-                    print(f"[DEBUG] No current_step found, setting to 'start'")
-                else:
-                    print(f"[DEBUG] Using existing current_step: {state['current_step']}")
-                
-                print(f"[DEBUG] Cleared error, error_step, set can_continue=True, workflow_paused=False.")
 
-            print(f"[DEBUG] Final state before sleep/return: {state}")
-            await asyncio.sleep(0.5)
-            print(f"[DEBUG] Returning state from start_workflow.")
+            _append_messages(state, pending_msgs)
+
+            # Build the shared API clients up front so later steps reuse them
+            get_api_clients()
+
+            # List branches while JIRA is queried; discovery picks the result up
+            if "branch_discovery" not in _completed_steps(state):
+                _start_branch_prefetch(state)
+
             return state
 
         except Exception as e:
-            print(f"[ERROR] Exception in start_workflow: {e}")
+            logger.error("Exception in start_workflow: %s", e)
             return handle_workflow_error(state, "start", str(e))
 
     @log_workflow_function(level=LogLevel.INFO, include_state=True, include_result=False, include_execution_time=True, log_errors=True)
@@ -449,12 +1075,10 @@ def create_release_workflow() -> StateGraph:
                 content="🎫 **Step 1: Collecting JIRA Tickets**\n"
                 f"Searching for tickets with fix version: {state['fix_version']}...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            jira_client = clients.jira
+            # Shared API clients (built once per process)
+            jira_client = get_api_clients().jira
 
             try:
                 # Get tickets by fix version
@@ -491,7 +1115,7 @@ def create_release_workflow() -> StateGraph:
                         "Please verify the fix version or check JIRA configuration.\n\n"
                     )
 
-                state["messages"] = add_messages(state["messages"], [result_msg])
+                pending_msgs.append(result_msg)
 
             except Exception as api_error:
                 # Log the error and fall back to mock data for development
@@ -499,7 +1123,7 @@ def create_release_workflow() -> StateGraph:
                     content=f"⚠️  JIRA API error: {str(api_error)}\n"
                     "Falling back to mock data for development...\n\n"
                 )
-                state["messages"] = add_messages(state["messages"], [error_msg])
+                pending_msgs.append(error_msg)
 
                 # Mock fallback data
                 jira_tickets = [
@@ -535,10 +1159,11 @@ def create_release_workflow() -> StateGraph:
                     )
                     + "\n\n"
                 )
-                state["messages"] = add_messages(state["messages"], [mock_result_msg])
+                pending_msgs.append(mock_result_msg)
+
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("jira_collection")
-            await asyncio.sleep(1)
+            _mark_step_completed(state, "jira_collection")
             return state
 
         except Exception as e:
@@ -558,81 +1183,35 @@ def create_release_workflow() -> StateGraph:
                 content="🌳 **Step 2: Feature Branch Discovery**\n"
                 "Searching for feature branches in repositories...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             jira_tickets = state.get("jira_tickets", [])
             ticket_ids = [ticket["id"] for ticket in jira_tickets]
 
             feature_branches = {}
             missing_branches = {}
-
-            for repo in state["repositories"]:
-                repo_branches = []
-                repo_missing = []
-
-                try:
-                    # Get all branches for the repository
-                    branches = await github_client.get_branches(repo)
-                    branch_names = [branch.name for branch in branches]
-
-                    # Look for feature branches matching pattern: feature/{JIRA-ID}
-                    for ticket_id in ticket_ids:
-                        feature_pattern = f"feature/{ticket_id}"
-                        if feature_pattern in branch_names:
-                            repo_branches.append(feature_pattern)
-                        else:
-                            repo_missing.append(ticket_id)
-
+            prefetched_branches = await _take_branch_prefetch(state)
+
+            # Seed the per-run branch cache used by the release and rollback steps
+            branch_cache = state.setdefault("branch_cache", {})
+            for repo, names in prefetched_branches.items():
+                if not isinstance(names, BaseException):
+                    branch_cache[repo] = set(names)
+
+            async for kind, payload in _discover_stream(
+                github_client, state["repositories"], ticket_ids, prefetched_branches
+            ):
+                if kind == "msg":
+                    pending_msgs.append(payload)
+                    await _emit_progress("branch_discovery", payload)
+                else:
+                    repo, repo_branches, repo_missing = payload
                     feature_branches[repo] = repo_branches
                     missing_branches[repo] = repo_missing
 
-                    # Report findings for this repository
-                    found_count = len(repo_branches)
-                    missing_count = len(repo_missing)
-
-                    branch_status = (
-                        f"  📁 {repo}: {found_count} found, {missing_count} missing\n"
-                    )
-                    for branch in repo_branches:
-                        branch_status += f"    ✅ {branch}\n"
-                    for missing in repo_missing:
-                        branch_status += f"    ❌ feature/{missing} - not found\n"
-
-                    branch_msg = AIMessage(content=branch_status)
-                    state["messages"] = add_messages(state["messages"], [branch_msg])
-                    await asyncio.sleep(0.5)
-
-                except Exception as api_error:
-                    # Fall back to mock data for this repository
-                    error_msg = AIMessage(
-                        content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
-                        f"  🔧 Using mock data for {repo}...\n"
-                    )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
-
-                    # Mock data fallback
-                    mock_branches = [
-                        f"feature/{ticket_id}" for ticket_id in ticket_ids[:2]
-                    ]  # First 2 tickets
-                    mock_missing = ticket_ids[2:]  # Remaining tickets
-
-                    feature_branches[repo] = mock_branches
-                    missing_branches[repo] = mock_missing
-
-                    mock_status = f"  📁 {repo} (mock):\n"
-                    for branch in mock_branches:
-                        mock_status += f"    ✅ {branch}\n"
-                    for missing in mock_missing:
-                        mock_status += f"    ❌ feature/{missing} - not found\n"
-
-                    mock_msg = AIMessage(content=mock_status)
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
-
             state["feature_branches"] = feature_branches
             state["missing_branches"] = missing_branches
 
@@ -646,9 +1225,10 @@ def create_release_workflow() -> StateGraph:
                 f"• Total missing branches: {total_missing}\n"
                 f"• Repositories scanned: {len(state['repositories'])}\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(summary_msg)
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("branch_discovery")
+            _mark_step_completed(state, "branch_discovery")
             return state
 
         except Exception as e:
@@ -668,12 +1248,10 @@ def create_release_workflow() -> StateGraph:
                 content="🔀 **Step 3: Merge Status Validation**\n"
                 f"Checking if feature branches are merged to {state['sprint_name']}...\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             feature_branches = state.get("feature_branches", {})
             merge_status = {}
@@ -685,15 +1263,16 @@ def create_release_workflow() -> StateGraph:
                 repo_unmerged = []
 
                 try:
-                    for branch in repo_branches:
-                        # Check if branch is merged into sprint branch
-                        is_merged = await github_client.is_branch_merged(
-                            repo, branch, state["sprint_name"]
+                    # Check all branches against the sprint branch in one request
+                    if repo_branches:
+                        repo_merge_status = await github_client.batch_merged_status(
+                            repo, state["sprint_name"], repo_branches
                         )
-                        repo_merge_status[branch] = is_merged
-
-                        if not is_merged:
-                            repo_unmerged.append(branch)
+                    repo_unmerged = [
+                        branch
+                        for branch, is_merged in repo_merge_status.items()
+                        if not is_merged
+                    ]
 
                     merge_status[repo] = repo_merge_status
                     unmerged_branches[repo] = repo_unmerged
@@ -707,8 +1286,7 @@ def create_release_workflow() -> StateGraph:
                             status_text += f"    ⚠️  {branch} → needs merge to {state['sprint_name']}\n"
 
                     status_msg = AIMessage(content=status_text)
-                    state["messages"] = add_messages(state["messages"], [status_msg])
-                    await asyncio.sleep(0.5)
+                    pending_msgs.append(status_msg)
 
                 except Exception as api_error:
                     # Fall back to mock data for this repository
@@ -716,7 +1294,7 @@ def create_release_workflow() -> StateGraph:
                         content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
                         f"  🔧 Using mock merge status for {repo}...\n"
                     )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
+                    pending_msgs.append(error_msg)
 
                     # Mock merge status - assume first branches are merged, others are not
                     mock_merge_status = {}
@@ -739,7 +1317,7 @@ def create_release_workflow() -> StateGraph:
                             mock_status += f"    ⚠️  {branch} → needs merge\n"
 
                     mock_msg = AIMessage(content=mock_status)
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
+                    pending_msgs.append(mock_msg)
 
             state["merge_status"] = merge_status
             state["unmerged_branches"] = unmerged_branches
@@ -753,22 +1331,23 @@ def create_release_workflow() -> StateGraph:
             )
             total_merged = total_branches - total_unmerged
 
-            summary_msg = AIMessage(
-                content=f"\n📊 **Merge Status Summary:**\n"
+            summary_parts = [
+                f"\n📊 **Merge Status Summary:**\n"
                 f"• Total branches checked: {total_branches}\n"
                 f"• Merged to {state['sprint_name']}: {total_merged}\n"
                 f"• Require merging: {total_unmerged}\n\n"
-            )
+            ]
 
             if total_unmerged > 0:
-                summary_msg.content += (
+                summary_parts.append(
                     "⚠️  **Action Required:** Some branches need to be merged to the sprint branch "
                     "before proceeding with the release.\n\n"
                 )
 
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(AIMessage(content="".join(summary_parts)))
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("merge_validation")
+            _mark_step_completed(state, "merge_validation")
             return state
 
         except Exception as e:
@@ -790,32 +1369,33 @@ def create_release_workflow() -> StateGraph:
                 content=f"🔀 **Step 5: Merging {state['sprint_name']} to develop**\n"
                 "Creating pull requests and performing merges...\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             sprint_merge_results = {}
             merge_conflicts = {}
             successful_merges = []
 
-            for repo in state["repositories"]:
+            # PR title and description are the same for every repository
+            pr_title = f"Merge {state['sprint_name']} to develop - Release {state['fix_version']}"
+            # Shared cached ticket lines, minus the final line break
+            ticket_lines = "".join(
+                _format_ticket_lines(_ticket_key(state.get("jira_tickets", [])))
+            )[:-1]
+            pr_description = (
+                f"Automated merge of {state['sprint_name']} branch to develop for release {state['fix_version']}.\n\n"
+                "**Included Changes:**\n"
+                f"{ticket_lines}"
+            )
+
+            async def _merge_repo(repo: str) -> Dict[str, Any]:
+                repo_msgs: List[AIMessage] = []
                 try:
-                    # Create pull request from sprint branch to develop
-                    pr_title = f"Merge {state['sprint_name']} to develop - Release {state['fix_version']}"
-                    pr_description = (
-                        f"Automated merge of {state['sprint_name']} branch to develop for release {state['fix_version']}.\n\n"
-                        "**Included Changes:**\n"
-                        + "\n".join(
-                            [
-                                f"- {ticket['id']}: {ticket['summary']}"
-                                for ticket in state.get("jira_tickets", [])
-                            ]
-                        )
-                    )
+                    _ensure_github_available(state)
 
+                    # Create pull request from sprint branch to develop
                     # Check if branches exist and create PR
                     pr = await github_client.create_pull_request(
                         repo_name=repo,
@@ -838,87 +1418,96 @@ def create_release_workflow() -> StateGraph:
                             target_branch="develop",
                         )
 
-                        sprint_merge_results[repo] = {
-                            "status": "success",
-                            "pr_url": pr.html_url,
-                            "pr_number": pr.number,
-                            "merge_sha": merge_result.sha if merge_result else None,
-                        }
-                        successful_merges.append(repo)
-
-                        success_msg = AIMessage(
-                            content=f"  📁 {repo}: ✅ Merged successfully\n"
-                            f"    📝 PR: {pr.html_url}\n"
+                        result = RepoMergeResult(
+                            status="success",
+                            pr_url=pr.html_url,
+                            pr_number=pr.number,
+                            merge_sha=merge_result.sha if merge_result else None,
                         )
-                        state["messages"] = add_messages(
-                            state["messages"], [success_msg]
+
+                        repo_msgs.append(
+                            AIMessage(
+                                content=f"  📁 {repo}: ✅ Merged successfully\n"
+                                f"    📝 PR: {pr.html_url}\n"
+                            )
                         )
 
                     except Exception as merge_error:
                         # Handle merge conflicts
                         conflict_msg = str(merge_error)
-                        if (
-                            "conflict" in conflict_msg.lower()
-                            or "merge conflict" in conflict_msg.lower()
-                        ):
-                            sprint_merge_results[repo] = {
-                                "status": "conflict",
-                                "pr_url": pr.html_url,
-                                "pr_number": pr.number,
-                                "error": conflict_msg,
-                            }
-                            merge_conflicts[repo] = conflict_msg
-
-                            conflict_msg_obj = AIMessage(
-                                content=f"  📁 {repo}: ⚠️  Merge conflict detected\n"
-                                f"    📝 PR: {pr.html_url}\n"
-                                f"    🔧 Manual resolution required\n"
+                        if "conflict" in conflict_msg.casefold():
+                            result = RepoMergeResult(
+                                status="conflict",
+                                pr_url=pr.html_url,
+                                pr_number=pr.number,
+                                error=conflict_msg,
                             )
-                            state["messages"] = add_messages(
-                                state["messages"], [conflict_msg_obj]
+
+                            repo_msgs.append(
+                                AIMessage(
+                                    content=f"  📁 {repo}: ⚠️  Merge conflict detected\n"
+                                    f"    📝 PR: {pr.html_url}\n"
+                                    f"    🔧 Manual resolution required\n"
+                                )
                             )
                         else:
                             # Other merge error
-                            sprint_merge_results[repo] = {
-                                "status": "error",
-                                "pr_url": pr.html_url,
-                                "pr_number": pr.number,
-                                "error": conflict_msg,
-                            }
-
-                            error_msg = AIMessage(
-                                content=f"  📁 {repo}: ❌ Merge failed\n"
-                                f"    📝 PR: {pr.html_url}\n"
-                                f"    🔧 Error: {conflict_msg}\n"
+                            result = RepoMergeResult(
+                                status="error",
+                                pr_url=pr.html_url,
+                                pr_number=pr.number,
+                                error=conflict_msg,
                             )
-                            state["messages"] = add_messages(
-                                state["messages"], [error_msg]
+
+                            repo_msgs.append(
+                                AIMessage(
+                                    content=f"  📁 {repo}: ❌ Merge failed\n"
+                                    f"    📝 PR: {pr.html_url}\n"
+                                    f"    🔧 Error: {conflict_msg}\n"
+                                )
                             )
 
                 except Exception as api_error:
+                    _record_github_error(state, api_error)
                     # Fall back to mock data for this repository
-                    error_msg = AIMessage(
-                        content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
-                        f"  🔧 Simulating merge for {repo}...\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
+                            f"  🔧 Simulating merge for {repo}...\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
 
                     # Mock successful merge
-                    sprint_merge_results[repo] = {
-                        "status": "success",
-                        "pr_url": f"https://github.com/company/{repo}/pull/100",
-                        "pr_number": 100,
-                        "merge_sha": "abc123def456",
-                    }
-                    successful_merges.append(repo)
+                    result = RepoMergeResult(
+                        status="success",
+                        pr_url=f"https://github.com/company/{repo}/pull/100",
+                        pr_number=100,
+                        merge_sha="abc123def456",
+                    )
 
-                    mock_msg = AIMessage(
-                        content=f"  📁 {repo} (mock): ✅ Merge simulated\n"
-                        f"    📝 PR: {sprint_merge_results[repo]['pr_url']}\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo} (mock): ✅ Merge simulated\n"
+                            f"    📝 PR: {result.pr_url}\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
 
-                await asyncio.sleep(0.5)
+                return {"repo": repo, "result": result, "messages": repo_msgs}
+
+            # Process all repositories concurrently, streaming progress as each
+            # finishes; outcomes keep input order
+            outcomes = await _stream_repo_outcomes(
+                "sprint_merging", [_merge_repo(repo) for repo in state["repositories"]]
+            )
+
+            for outcome in outcomes:
+                repo, result = outcome["repo"], outcome["result"]
+                sprint_merge_results[repo] = result
+                if result.status == "success":
+                    successful_merges.append(repo)
+                elif result.status == "conflict":
+                    merge_conflicts[repo] = result.error
+                pending_msgs.extend(outcome["messages"])
 
             state["sprint_merge_results"] = sprint_merge_results
             state["merge_conflicts"] = merge_conflicts
@@ -929,23 +1518,24 @@ def create_release_workflow() -> StateGraph:
             conflict_count = len(merge_conflicts)
             total_repos = len(state["repositories"])
 
-            summary_msg = AIMessage(
-                content=f"\n📊 **Sprint Merge Summary:**\n"
+            summary_parts = [
+                f"\n📊 **Sprint Merge Summary:**\n"
                 f"• Successful merges: {success_count}/{total_repos}\n"
                 f"• Merge conflicts: {conflict_count}\n"
                 f"• Total repositories: {total_repos}\n\n"
-            )
+            ]
 
             if conflict_count > 0:
-                summary_msg.content += (
+                summary_parts.append(
                     "⚠️  **Manual Action Required:** Resolve merge conflicts in the following repositories:\n"
-                    + "\n".join([f"  • {repo}" for repo in merge_conflicts.keys()])
-                    + "\n\n"
                 )
+                summary_parts.append("\n".join(f"  • {repo}" for repo in merge_conflicts))
+                summary_parts.append("\n\n")
 
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(AIMessage(content="".join(summary_parts)))
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("sprint_merging")
+            _mark_step_completed(state, "sprint_merging")
             return state
 
         except Exception as e:
@@ -965,12 +1555,10 @@ def create_release_workflow() -> StateGraph:
                 content=f"\n🌿 **Step 6: Creating Release Branches**\n"
                 f"Analyzing existing versions and creating release branches...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             release_branches = []
             version_info = {}
@@ -984,89 +1572,113 @@ def create_release_workflow() -> StateGraph:
                 f"• Calculated semantic version: {calculated_version}\n"
                 f"• Release type: {state.get('release_type', 'release')}\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [version_msg])
+            pending_msgs.append(version_msg)
 
-            for repo in state["repositories"]:
+            release_branch_name = f"release/{calculated_version}"
+            existing = await _branches_exist(
+                github_client,
+                state,
+                [(repo, release_branch_name) for repo in state["repositories"]],
+            )
+
+            async def _create_release_branch(repo: str) -> Dict[str, Any]:
+                repo_msgs: List[AIMessage] = []
                 try:
+                    _ensure_github_available(state)
+
                     # Create release branch from develop
-                    branch_name = f"release/{calculated_version}"
+                    branch_name = release_branch_name
 
                     # Check if release branch already exists
-                    existing_branches = await github_client.get_branches(repo)
-                    branch_names = [branch.name for branch in existing_branches]
+                    exists = existing.get((repo, branch_name))
+                    if exists is None:
+                        branch_names = await _get_branch_names(
+                            github_client, state, repo
+                        )
+                        exists = branch_name in branch_names
 
-                    if branch_name in branch_names:
+                    if exists:
                         # Branch already exists
-                        version_info[repo] = {
+                        info = {
                             "status": "exists",
                             "branch": branch_name,
                             "base": "develop",
                         }
 
-                        exists_msg = AIMessage(
-                            content=f"  📁 {repo}: ⚠️  {branch_name} already exists\n"
-                        )
-                        state["messages"] = add_messages(
-                            state["messages"], [exists_msg]
+                        repo_msgs.append(
+                            AIMessage(
+                                content=f"  📁 {repo}: ⚠️  {branch_name} already exists\n"
+                            )
                         )
                     else:
                         # Create new release branch
                         new_branch = await github_client.create_branch(
                             repo=repo, branch_name=branch_name, source_branch="develop"
                         )
+                        _remember_branch(state, repo, branch_name)
 
-                        version_info[repo] = {
+                        info = {
                             "status": "created",
                             "branch": branch_name,
                             "base": "develop",
                             "sha": new_branch.sha,
                         }
 
-                        success_msg = AIMessage(
-                            content=f"  📁 {repo}: ✅ {branch_name} created from develop\n"
-                        )
-                        state["messages"] = add_messages(
-                            state["messages"], [success_msg]
+                        repo_msgs.append(
+                            AIMessage(
+                                content=f"  📁 {repo}: ✅ {branch_name} created from develop\n"
+                            )
                         )
 
-                    release_branches.append(f"{repo}:{branch_name}")
-
                 except Exception as api_error:
+                    _record_github_error(state, api_error)
                     # Fall back to mock data for this repository
-                    error_msg = AIMessage(
-                        content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
-                        f"  🔧 Simulating branch creation for {repo}...\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
+                            f"  🔧 Simulating branch creation for {repo}...\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
 
                     # Mock branch creation
-                    branch_name = f"release/{calculated_version}"
-                    version_info[repo] = {
+                    branch_name = release_branch_name
+                    info = {
                         "status": "created",
                         "branch": branch_name,
                         "base": "develop",
                         "sha": "mock_sha_123",
                     }
-                    release_branches.append(f"{repo}:{branch_name}")
 
-                    mock_msg = AIMessage(
-                        content=f"  📁 {repo} (mock): ✅ {branch_name} simulated\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo} (mock): ✅ {branch_name} simulated\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
 
-                await asyncio.sleep(0.5)
+                return {"repo": repo, "info": info, "messages": repo_msgs}
+
+            # Process all repositories concurrently, streaming progress as each
+            # finishes; outcomes keep input order
+            outcomes = await _stream_repo_outcomes(
+                "release_creation",
+                [_create_release_branch(repo) for repo in state["repositories"]],
+            )
+
+            status_counts: Counter = Counter()
+            for outcome in outcomes:
+                repo, info = outcome["repo"], outcome["info"]
+                version_info[repo] = info
+                status_counts[info["status"]] += 1
+                release_branches.append(f"{repo}:{info['branch']}")
+                pending_msgs.extend(outcome["messages"])
 
             state["release_branches"] = release_branches
             state["calculated_version"] = calculated_version
             state["version_info"] = version_info
 
             # Summary
-            created_count = sum(
-                1 for info in version_info.values() if info["status"] == "created"
-            )
-            existing_count = sum(
-                1 for info in version_info.values() if info["status"] == "exists"
-            )
+            created_count = status_counts["created"]
+            existing_count = status_counts["exists"]
 
             summary_msg = AIMessage(
                 content=f"\n📊 **Release Branch Summary:**\n"
@@ -1075,9 +1687,10 @@ def create_release_workflow() -> StateGraph:
                 f"• Existing branches: {existing_count}\n"
                 f"• Total repositories: {len(state['repositories'])}\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(summary_msg)
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("release_creation")
+            _mark_step_completed(state, "release_creation")
             return state
 
         except Exception as e:
@@ -1097,12 +1710,10 @@ def create_release_workflow() -> StateGraph:
                 content=f"\n📝 **Step 7: Generating Pull Requests**\n"
                 "Creating PRs from release branches to master...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             calculated_version = state.get(
                 "calculated_version", state.get("fix_version", "v1.0.0")
@@ -1110,13 +1721,15 @@ def create_release_workflow() -> StateGraph:
             pull_requests = []
             pr_creation_results = {}
 
-            for repo in state["repositories"]:
-                try:
-                    release_branch = f"release/{calculated_version}"
+            # Generate comprehensive PR description once for all repositories
+            pr_title = f"Release {calculated_version}"
+            pr_description = _generate_pr_description(state, calculated_version)
+            release_branch = f"release/{calculated_version}"
 
-                    # Generate comprehensive PR description
-                    pr_title = f"Release {calculated_version}"
-                    pr_description = _generate_pr_description(state, calculated_version)
+            async def _create_release_pr(index: int, repo: str) -> Dict[str, Any]:
+                repo_msgs: List[AIMessage] = []
+                try:
+                    _ensure_github_available(state)
 
                     # Create pull request from release branch to master
                     pr = await github_client.create_pull_request(
@@ -1136,63 +1749,73 @@ def create_release_workflow() -> StateGraph:
                         "base": "master",
                         "status": "created",
                     }
+                    result = {"status": "success", "pr": pr_info}
 
-                    pull_requests.append(pr_info)
-                    pr_creation_results[repo] = {"status": "success", "pr": pr_info}
-
-                    success_msg = AIMessage(
-                        content=f"  📁 {repo}: ✅ PR created\n"
-                        f"    📝 {pr.html_url}\n"
-                        f"    🔀 {release_branch} → master\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo}: ✅ PR created\n"
+                            f"    📝 {pr.html_url}\n"
+                            f"    🔀 {release_branch} → master\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [success_msg])
 
                 except Exception as api_error:
+                    _record_github_error(state, api_error)
                     # Handle PR creation error
-                    error_msg = AIMessage(
-                        content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
-                        f"  🔧 Simulating PR creation for {repo}...\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
+                            f"  🔧 Simulating PR creation for {repo}...\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
 
                     # Mock PR creation
-                    mock_pr_number = 100 + len(pull_requests)
-                    mock_pr_info = {
+                    mock_pr_number = 100 + index
+                    pr_info = {
                         "repo": repo,
                         "url": f"https://github.com/company/{repo}/pull/{mock_pr_number}",
                         "number": mock_pr_number,
-                        "title": f"Release {calculated_version}",
-                        "head": f"release/{calculated_version}",
+                        "title": pr_title,
+                        "head": release_branch,
                         "base": "master",
                         "status": "mock",
                     }
+                    result = {"status": "mock", "pr": pr_info}
 
-                    pull_requests.append(mock_pr_info)
-                    pr_creation_results[repo] = {"status": "mock", "pr": mock_pr_info}
-
-                    mock_msg = AIMessage(
-                        content=f"  📁 {repo} (mock): ✅ PR simulated\n"
-                        f"    📝 {mock_pr_info['url']}\n"
-                        f"    🔀 {mock_pr_info['head']} → {mock_pr_info['base']}\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo} (mock): ✅ PR simulated\n"
+                            f"    📝 {pr_info['url']}\n"
+                            f"    🔀 {pr_info['head']} → {pr_info['base']}\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
 
-                await asyncio.sleep(0.5)
+                return {"repo": repo, "result": result, "messages": repo_msgs}
+
+            # Process all repositories concurrently, streaming progress as each
+            # finishes; outcomes keep input order
+            outcomes = await _stream_repo_outcomes(
+                "pr_generation",
+                [
+                    _create_release_pr(index, repo)
+                    for index, repo in enumerate(state["repositories"])
+                ],
+            )
+
+            status_counts: Counter = Counter()
+            for outcome in outcomes:
+                result = outcome["result"]
+                pull_requests.append(result["pr"])
+                pr_creation_results[outcome["repo"]] = result
+                status_counts[result["status"]] += 1
+                pending_msgs.extend(outcome["messages"])
 
             state["pull_requests"] = pull_requests
             state["pr_creation_results"] = pr_creation_results
 
             # Summary
-            created_count = sum(
-                1
-                for result in pr_creation_results.values()
-                if result["status"] == "success"
-            )
-            mock_count = sum(
-                1
-                for result in pr_creation_results.values()
-                if result["status"] == "mock"
-            )
+            created_count = status_counts["success"]
+            mock_count = status_counts["mock"]
 
             summary_msg = AIMessage(
                 content=f"\n📊 **Pull Request Summary:**\n"
@@ -1205,9 +1828,10 @@ def create_release_workflow() -> StateGraph:
                 "• Merge PRs to deploy to production\n"
                 "• Monitor deployment status\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(summary_msg)
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("pr_generation")
+            _mark_step_completed(state, "pr_generation")
             return state
 
         except Exception as e:
@@ -1231,23 +1855,24 @@ def create_release_workflow() -> StateGraph:
                 content=f"\n🏷️ **Step 8: Creating Release Tags**\n"
                 f"Tagging release branches with {calculated_version}...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             release_tags = []
             tag_creation_results = {}
 
-            for repo in state["repositories"]:
+            # Generate tag message with release information once for all repositories
+            tag_message = _generate_tag_message(state, calculated_version)
+            release_branch = f"release/{calculated_version}"
+
+            async def _create_release_tag(repo: str) -> Dict[str, Any]:
+                repo_msgs: List[AIMessage] = []
                 try:
-                    release_branch = f"release/{calculated_version}"
-                    tag_name = calculated_version
+                    _ensure_github_available(state)
 
-                    # Generate tag message with release information
-                    tag_message = _generate_tag_message(state, calculated_version)
+                    tag_name = calculated_version
 
                     # Create Git tag on the release branch
                     tag = await github_client.create_tag(
@@ -1266,64 +1891,68 @@ def create_release_workflow() -> StateGraph:
                         "message": tag_message,
                         "status": "created",
                     }
+                    result = {"status": "success", "tag": tag_info}
 
-                    release_tags.append(tag_info)
-                    tag_creation_results[repo] = {"status": "success", "tag": tag_info}
-
-                    success_msg = AIMessage(
-                        content=f"  📁 {repo}: ✅ Tag {tag_name} created\n"
-                        f"    🏷️  SHA: {tag.sha[:8]}\n"
-                        f"    🌿 Branch: {release_branch}\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo}: ✅ Tag {tag_name} created\n"
+                            f"    🏷️  SHA: {tag.sha[:8]}\n"
+                            f"    🌿 Branch: {release_branch}\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [success_msg])
 
                 except Exception as api_error:
+                    _record_github_error(state, api_error)
                     # Handle tag creation error
-                    error_msg = AIMessage(
-                        content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
-                        f"  🔧 Simulating tag creation for {repo}...\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
+                            f"  🔧 Simulating tag creation for {repo}...\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
 
                     # Mock tag creation
-                    mock_tag_info = {
+                    tag_info = {
                         "repo": repo,
                         "tag": calculated_version,
                         "sha": "mock_sha_789",
-                        "branch": f"release/{calculated_version}",
-                        "message": _generate_tag_message(state, calculated_version),
-                        "status": "mock",
-                    }
-
-                    release_tags.append(mock_tag_info)
-                    tag_creation_results[repo] = {
+                        "branch": release_branch,
+                        "message": tag_message,
                         "status": "mock",
-                        "tag": mock_tag_info,
                     }
+                    result = {"status": "mock", "tag": tag_info}
 
-                    mock_msg = AIMessage(
-                        content=f"  📁 {repo} (mock): ✅ Tag {calculated_version} simulated\n"
-                        f"    🏷️  SHA: {mock_tag_info['sha']}\n"
-                        f"    🌿 Branch: {mock_tag_info['branch']}\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo} (mock): ✅ Tag {calculated_version} simulated\n"
+                            f"    🏷️  SHA: {tag_info['sha']}\n"
+                            f"    🌿 Branch: {tag_info['branch']}\n"
+                        )
                     )
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
 
-                await asyncio.sleep(0.5)
+                return {"repo": repo, "result": result, "messages": repo_msgs}
+
+            # Process all repositories concurrently, streaming progress as each
+            # finishes; outcomes keep input order
+            outcomes = await _stream_repo_outcomes(
+                "release_tagging",
+                [_create_release_tag(repo) for repo in state["repositories"]],
+            )
+
+            status_counts: Counter = Counter()
+            for outcome in outcomes:
+                result = outcome["result"]
+                release_tags.append(result["tag"])
+                tag_creation_results[outcome["repo"]] = result
+                status_counts[result["status"]] += 1
+                pending_msgs.extend(outcome["messages"])
 
             state["release_tags"] = release_tags
             state["tag_creation_results"] = tag_creation_results
 
             # Summary
-            created_count = sum(
-                1
-                for result in tag_creation_results.values()
-                if result["status"] == "success"
-            )
-            mock_count = sum(
-                1
-                for result in tag_creation_results.values()
-                if result["status"] == "mock"
-            )
+            created_count = status_counts["success"]
+            mock_count = status_counts["mock"]
 
             summary_msg = AIMessage(
                 content=f"\n📊 **Release Tag Summary:**\n"
@@ -1336,9 +1965,10 @@ def create_release_workflow() -> StateGraph:
                 "• Tags point to latest commit on release branches\n"
                 "• Tags include release metadata and changelog\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(summary_msg)
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("release_tagging")
+            _mark_step_completed(state, "release_tagging")
             return state
 
         except Exception as e:
@@ -1354,6 +1984,10 @@ def create_release_workflow() -> StateGraph:
 
             state["current_step"] = "rollback_preparation"
 
+            # Look up the Confluence page while the GitHub work runs
+            if "documentation" not in _completed_steps(state):
+                _start_doc_page_prefetch(state)
+
             calculated_version = state.get(
                 "calculated_version", state.get("fix_version", "v1.0.0")
             )
@@ -1362,108 +1996,128 @@ def create_release_workflow() -> StateGraph:
                 content=f"\n🔄 **Step 9: Preparing Rollback Branches**\n"
                 f"Creating rollback branches from master for version {calculated_version}...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            github_client = clients.github
+            # Shared API clients (built once per process)
+            github_client = get_api_clients().github
 
             rollback_branches = []
-            rollback_creation_results = {}
+            rollback_creation_results: Dict[str, RollbackResult] = {}
+
+            rollback_branch_name = f"rollback/v-{calculated_version.replace('v', '')}"
+            repositories = state["repositories"]
+            existing = await _branches_exist(
+                github_client,
+                state,
+                [(repo, rollback_branch_name) for repo in repositories],
+            )
 
-            for repo in state["repositories"]:
-                try:
-                    # Create standardized rollback branch name
-                    rollback_branch = (
-                        f"rollback/v-{calculated_version.replace('v', '')}"
+            async def _rollback_branch_exists(repo: str) -> bool:
+                _ensure_github_available(state)
+                exists = existing.get((repo, rollback_branch_name))
+                if exists is None:
+                    branch_names = await _github_bounded(
+                        _get_branch_names(github_client, state, repo)
                     )
+                    exists = rollback_branch_name in branch_names
+                return exists
 
-                    # Check if rollback branch already exists
-                    existing_branches = await github_client.get_branches(repo)
-                    branch_names = [branch.name for branch in existing_branches]
-
-                    if rollback_branch in branch_names:
-                        # Branch already exists
-                        rollback_creation_results[repo] = {
-                            "status": "exists",
-                            "branch": rollback_branch,
-                            "base": "master",
-                        }
+            # Existence per repository; lookup failures are kept per repository
+            checks = await asyncio.gather(
+                *(_rollback_branch_exists(repo) for repo in repositories),
+                return_exceptions=True,
+            )
+            creation: Dict[str, Any] = dict(zip(repositories, checks))
 
-                        exists_msg = AIMessage(
-                            content=f"  📁 {repo}: ⚠️  {rollback_branch} already exists\n"
-                        )
-                        state["messages"] = add_messages(
-                            state["messages"], [exists_msg]
-                        )
-                    else:
-                        # Create new rollback branch from master HEAD
-                        new_branch = await github_client.create_branch(
-                            repo=repo,
-                            branch_name=rollback_branch,
+            # Create every missing rollback branch from master HEAD in one batch
+            missing = [repo for repo, exists in creation.items() if exists is False]
+            if missing:
+                pairs = [(repo, rollback_branch_name) for repo in missing]
+                try:
+                    _ensure_github_available(state)
+                    created = await _github_bounded(
+                        github_client.bulk_create_branches(
+                            pairs,
                             source_branch="master",  # or "main" depending on repository default
                         )
+                    )
+                except Exception as api_error:
+                    created = dict.fromkeys(pairs, api_error)
+                for pair in pairs:
+                    creation[pair[0]] = created[pair]
 
-                        rollback_creation_results[repo] = {
-                            "status": "created",
-                            "branch": rollback_branch,
-                            "base": "master",
-                            "sha": new_branch.sha,
-                        }
+            status_counts: Counter = Counter()
+            for repo in repositories:
+                outcome = creation[repo]
+                repo_msgs: List[AIMessage] = []
 
-                        success_msg = AIMessage(
-                            content=f"  📁 {repo}: ✅ {rollback_branch} created from master\n"
-                            f"    🔗 SHA: {new_branch.sha[:8]}\n"
-                        )
-                        state["messages"] = add_messages(
-                            state["messages"], [success_msg]
+                if isinstance(outcome, BaseException):
+                    _record_github_error(state, outcome)
+                    # Fall back to mock data for this repository
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  ⚠️  GitHub API error for {repo}: {str(outcome)}\n"
+                            f"  🔧 Simulating rollback branch creation for {repo}...\n"
                         )
+                    )
 
-                    rollback_branches.append(f"{repo}:{rollback_branch}")
+                    # Mock rollback branch creation
+                    result = RollbackResult(
+                        status=_ROLLBACK_CREATED,
+                        branch=rollback_branch_name,
+                        sha="mock_rollback_sha",
+                    )
 
-                except Exception as api_error:
-                    # Fall back to mock data for this repository
-                    error_msg = AIMessage(
-                        content=f"  ⚠️  GitHub API error for {repo}: {str(api_error)}\n"
-                        f"  🔧 Simulating rollback branch creation for {repo}...\n"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo} (mock): ✅ {rollback_branch_name} simulated\n"
+                            f"    🔗 SHA: mock_rollback_sha\n"
+                        )
+                    )
+                elif outcome is True:
+                    # Branch already exists
+                    result = RollbackResult(
+                        status=_ROLLBACK_EXISTS, branch=rollback_branch_name
                     )
-                    state["messages"] = add_messages(state["messages"], [error_msg])
 
-                    # Mock rollback branch creation
-                    rollback_branch = (
-                        f"rollback/v-{calculated_version.replace('v', '')}"
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo}: ⚠️  {rollback_branch_name} already exists\n"
+                        )
                     )
-                    rollback_creation_results[repo] = {
-                        "status": "created",
-                        "branch": rollback_branch,
-                        "base": "master",
-                        "sha": "mock_rollback_sha",
-                    }
-                    rollback_branches.append(f"{repo}:{rollback_branch}")
+                else:
+                    _remember_branch(state, repo, rollback_branch_name)
 
-                    mock_msg = AIMessage(
-                        content=f"  📁 {repo} (mock): ✅ {rollback_branch} simulated\n"
-                        f"    🔗 SHA: mock_rollback_sha\n"
+                    result = RollbackResult(
+                        status=_ROLLBACK_CREATED,
+                        branch=rollback_branch_name,
+                        sha=outcome.sha,
                     )
-                    state["messages"] = add_messages(state["messages"], [mock_msg])
 
-                await asyncio.sleep(0.5)
+                    repo_msgs.append(
+                        AIMessage(
+                            content=f"  📁 {repo}: ✅ {rollback_branch_name} created from master\n"
+                            f"    🔗 SHA: {outcome.sha[:8]}\n"
+                        )
+                    )
+
+                for message in repo_msgs:
+                    await _emit_progress("rollback_preparation", message)
+
+                rollback_creation_results[repo] = result
+                status_counts[result.status] += 1
+                rollback_branches.append(f"{repo}:{result.branch}")
+                pending_msgs.extend(repo_msgs)
 
             state["rollback_branches"] = rollback_branches
-            state["rollback_creation_results"] = rollback_creation_results
+            # Checkpointed state keeps plain dicts
+            state["rollback_creation_results"] = {
+                repo: asdict(result) for repo, result in rollback_creation_results.items()
+            }
 
             # Summary
-            created_count = sum(
-                1
-                for result in rollback_creation_results.values()
-                if result["status"] == "created"
-            )
-            existing_count = sum(
-                1
-                for result in rollback_creation_results.values()
-                if result["status"] == "exists"
-            )
+            created_count = status_counts[_ROLLBACK_CREATED]
+            existing_count = status_counts[_ROLLBACK_EXISTS]
 
             summary_msg = AIMessage(
                 content=f"\n📊 **Rollback Preparation Summary:**\n"
@@ -1475,16 +2129,17 @@ def create_release_workflow() -> StateGraph:
                 "1. In case of deployment issues, checkout rollback branch\n"
                 "2. Create emergency PR from rollback branch to master\n"
                 "3. Deploy rollback branch to restore previous state\n"
-                f"4. Branch naming pattern: `rollback/v-{calculated_version.replace('v', '')}`\n\n"
+                f"4. Branch naming pattern: `{rollback_branch_name}`\n\n"
                 "🚨 **Emergency Rollback Command:**\n"
                 f"```bash\n"
-                f"git checkout rollback/v-{calculated_version.replace('v', '')}\n"
+                f"git checkout {rollback_branch_name}\n"
                 f"# Deploy this version to production\n"
                 f"```\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [summary_msg])
+            pending_msgs.append(summary_msg)
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("rollback_preparation")
+            _mark_step_completed(state, "rollback_preparation")
             return state
 
         except Exception as e:
@@ -1501,142 +2156,93 @@ def create_release_workflow() -> StateGraph:
         release_branches = state.get("release_branches", [])
         rollback_branches = state.get("rollback_branches", [])
         calculated_version = state.get("calculated_version", fix_version)
-
-        # Generate current timestamp
-        from datetime import datetime
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+        # Branch name used when a repository has no recorded rollback branch
+        default_rollback_branch = escape(
+            f"rollback/v-{calculated_version.replace('v', '')}"
+        )
+        calculated_version = escape(calculated_version)
+
+        # Assemble the whole document as one list of fragments, joined once at the end
+        parts: List[str] = [
+            _DOC_HEADER.substitute(
+                fix_version=escape(str(fix_version)),
+                sprint_name=escape(str(sprint_name)),
+                release_type=escape(release_type.title()),
+                calculated_version=calculated_version,
+                # Filled in per upload so cached renders never carry a stale time
+                timestamp=_DOC_TIMESTAMP_MARKER,
+                repository_count=len(repositories),
+            )
+        ]
 
         # Build JIRA tickets table
-        jira_table_rows = []
         for ticket in jira_tickets:
-            jira_table_rows.append(
-                f"""
-                <tr>
-                    <td><a href="https://your-company.atlassian.net/browse/{ticket.get('key', 'N/A')}">{ticket.get('key', 'N/A')}</a></td>
-                    <td>{ticket.get('summary', 'N/A')}</td>
-                    <td>{ticket.get('status', 'N/A')}</td>
-                    <td>{ticket.get('assignee', 'N/A')}</td>
-                </tr>
-            """
+            parts.append(
+                _DOC_TICKET_ROW.substitute(
+                    key=escape(str(ticket.get("key", "N/A"))),
+                    summary=escape(str(ticket.get("summary", "N/A"))),
+                    status=escape(str(ticket.get("status", "N/A"))),
+                    assignee=escape(str(ticket.get("assignee", "N/A"))),
+                )
             )
+        if not jira_tickets:
+            parts.append(_DOC_NO_TICKETS)
 
-        jira_table = f"""
-            <table>
-                <thead>
-                    <tr>
-                        <th>JIRA ID</th>
-                        <th>Summary</th>
-                        <th>Status</th>
-                        <th>Assignee</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(jira_table_rows) if jira_table_rows else '<tr><td colspan="4">No JIRA tickets found</td></tr>'}
-                </tbody>
-            </table>
-        """
+        parts.append(_DOC_DEPLOYMENT_HEADER)
 
-        # Build deployment section for each repository
-        deployment_sections = []
-        rollback_sections = []
+        # Index PRs and "repo:branch" entries by repository; reversed so the first entry wins
+        pr_by_repo = {pr.get("repository"): pr for pr in reversed(pull_requests)}
+        release_by_repo = dict(
+            branch.split(":", 1) for branch in reversed(release_branches) if ":" in branch
+        )
+        rollback_by_repo = dict(
+            branch.split(":", 1) for branch in reversed(rollback_branches) if ":" in branch
+        )
+
+        # Deployment sections go straight into the document; rollback sections
+        # come later, so they are held back and spliced in after the heading
+        rollback_sections: List[str] = []
 
         for repo in repositories:
             # Find corresponding PR and branch info
-            repo_pr = None
-            repo_release_branch = None
-            repo_rollback_branch = None
-
-            for pr in pull_requests:
-                if pr.get("repository") == repo:
-                    repo_pr = pr
-                    break
-
-            for branch in release_branches:
-                if branch.startswith(f"{repo}:"):
-                    repo_release_branch = branch.split(":", 1)[1]
-                    break
-
-            for branch in rollback_branches:
-                if branch.startswith(f"{repo}:"):
-                    repo_rollback_branch = branch.split(":", 1)[1]
-                    break
-
-            # Jenkins URL (standardized format)
-            jenkins_url = f"https://jenkins.your-company.com/job/{repo}/job/{repo_release_branch or 'master'}/build"
-
-            deployment_sections.append(
-                f"""
-                <h4>{repo}</h4>
-                <ul>
-                    <li><strong>Jenkins Job:</strong> <a href="{jenkins_url}">{repo} - {repo_release_branch or 'master'}</a></li>
-                    <li><strong>Pull Request:</strong> {f'<a href="{repo_pr.get("url", "#")}">{repo_pr.get("title", "PR")}</a>' if repo_pr else 'N/A'}</li>
-                    <li><strong>Branch:</strong> {repo_release_branch or 'master'}</li>
-                    <li><strong>Version:</strong> {calculated_version}</li>
-                </ul>
-            """
+            repo_pr = pr_by_repo.get(repo)
+            repo_release_branch = release_by_repo.get(repo)
+            repo_rollback_branch = rollback_by_repo.get(repo)
+            repo_html = escape(repo)
+
+            parts.append(
+                _DOC_DEPLOYMENT_SECTION.substitute(
+                    repo=repo_html,
+                    branch=escape(repo_release_branch or "master"),
+                    pr_link=(
+                        _DOC_PR_LINK.substitute(
+                            url=escape(str(repo_pr.get("url", "#"))),
+                            title=escape(str(repo_pr.get("title", "PR"))),
+                        )
+                        if repo_pr
+                        else "N/A"
+                    ),
+                    calculated_version=calculated_version,
+                )
             )
 
             rollback_sections.append(
-                f"""
-                <h4>{repo}</h4>
-                <ul>
-                    <li><strong>Rollback Branch:</strong> {repo_rollback_branch or f'rollback/v-{calculated_version.replace("v", "")}'}</li>
-                    <li><strong>Emergency Jenkins Job:</strong> <a href="https://jenkins.your-company.com/job/{repo}/job/{repo_rollback_branch or 'master'}/build">{repo} - Rollback</a></li>
-                    <li><strong>Rollback Command:</strong> <code>git checkout {repo_rollback_branch or f'rollback/v-{calculated_version.replace("v", "")}'}</code></li>
-                </ul>
-            """
+                _DOC_ROLLBACK_SECTION.substitute(
+                    repo=repo_html,
+                    rollback_branch=(
+                        escape(repo_rollback_branch)
+                        if repo_rollback_branch
+                        else default_rollback_branch
+                    ),
+                    jenkins_branch=escape(repo_rollback_branch or "master"),
+                )
             )
 
-        # Generate complete HTML documentation
-        html_content = f"""
-        <h1>Release {fix_version} - Deployment Documentation</h1>
-        
-        <h2>Release Information</h2>
-        <table>
-            <tr><td><strong>Fix Version:</strong></td><td>{fix_version}</td></tr>
-            <tr><td><strong>Sprint:</strong></td><td>{sprint_name}</td></tr>
-            <tr><td><strong>Release Type:</strong></td><td>{release_type.title()}</td></tr>
-            <tr><td><strong>Version:</strong></td><td>{calculated_version}</td></tr>
-            <tr><td><strong>Generated:</strong></td><td>{timestamp}</td></tr>
-            <tr><td><strong>Repositories:</strong></td><td>{len(repositories)}</td></tr>
-        </table>
-        
-        <h2>JIRA Tickets Included</h2>
-        {jira_table}
-        
-        <h2>Deployment Plan</h2>
-        <p>Execute deployment in the following order:</p>
-        {''.join(deployment_sections)}
-        
-        <h2>Rollback Plan</h2>
-        <p><strong>⚠️ Emergency Rollback Procedures:</strong></p>
-        <p>In case of deployment issues, follow these steps for each repository:</p>
-        {''.join(rollback_sections)}
-        
-        <h2>Deployment Checklist</h2>
-        <ul>
-            <li>☐ All JIRA tickets are in "Done" status</li>
-            <li>☐ All feature branches merged to sprint branch</li>
-            <li>☐ Sprint branches merged to develop</li>
-            <li>☐ Release branches created and tagged</li>
-            <li>☐ Pull requests reviewed and approved</li>
-            <li>☐ Rollback branches prepared</li>
-            <li>☐ Jenkins jobs configured and tested</li>
-            <li>☐ Stakeholders notified of deployment window</li>
-        </ul>
-        
-        <h2>Emergency Contacts</h2>
-        <ul>
-            <li><strong>Release Manager:</strong> TBD</li>
-            <li><strong>DevOps Engineer:</strong> TBD</li>
-            <li><strong>On-Call Developer:</strong> TBD</li>
-        </ul>
-        
-        <p><em>Generated automatically by Project Enigma Release Automation</em></p>
-        """
+        parts.append(_DOC_ROLLBACK_HEADER)
+        parts.extend(rollback_sections)
+        parts.append(_DOC_FOOTER)
 
-        return html_content.strip()
+        return "".join(parts).strip()
 
     @log_workflow_function(level=LogLevel.INFO, include_state=True, include_result=False, include_execution_time=True, log_errors=True)
     async def generate_confluence_docs(state: WorkflowState) -> WorkflowState:
@@ -1652,66 +2258,108 @@ def create_release_workflow() -> StateGraph:
                 content=f"\n📚 **Step 10: Generating Confluence Documentation**\n"
                 "Creating comprehensive deployment documentation...\n"
             )
-            state["messages"] = add_messages(state["messages"], [msg])
+            pending_msgs: List[AIMessage] = [msg]
 
-            # Initialize API clients
-            factory = APIClientFactory()
-            clients = factory.create_all_clients()
-            confluence_client = clients.confluence
+            # Shared API clients (built once per process)
+            confluence_client = get_api_clients().confluence
 
             # Generate documentation content
-            doc_title = f"Release {state['fix_version']} - Deployment Documentation"
-            doc_content = _generate_deployment_documentation_content(state)
+            doc_title = _doc_title(state)
+            doc_key, doc_content = _cached_documentation(
+                state, _generate_deployment_documentation_content
+            )
+            # Hashed before stamping, so an unchanged document keeps its hash
+            content_hash = hashlib.blake2b(
+                doc_content.encode(), digest_size=16
+            ).hexdigest()
+            doc_content = _stamp_documentation(doc_content)
+
+            if state.get("confluence_content_hash") == content_hash and state.get(
+                "confluence_url"
+            ):
+                # This exact content is already uploaded; reuse the page URL
+                confluence_url = state["confluence_url"]
+                _discard_doc_page_prefetch(state)
+
+                unchanged_msg = AIMessage(
+                    content="  ✅ Documentation unchanged, skipping Confluence upload\n"
+                )
+                pending_msgs.append(unchanged_msg)
+            else:
+                try:
+                    # Attempt to create/update Confluence page
+                    settings = get_settings()
+                    space_key = settings.confluence_space_key
+
+                    # Page id/ETag/version from earlier runs, keyed by title;
+                    # usually already looked up during rollback preparation
+                    page_cache = state.setdefault("confluence_page_cache", {})
+                    lookup = _take_doc_page_prefetch(state) or _lookup_doc_page(
+                        confluence_client, space_key, doc_title, page_cache.get(doc_title)
+                    )
+                    existing_page = await lookup
+                    if existing_page:
+                        page_cache[doc_title] = existing_page
+                    else:
+                        page_cache.pop(doc_title, None)
 
-            try:
-                # Attempt to create/update Confluence page
-                settings = get_settings()
-                space_key = settings.confluence_space_key
+                    if existing_page and (
+                        state.get("doc_cache_key") == doc_key
+                        and state.get("doc_page_version") == existing_page["version"]
+                    ):
+                        # We wrote this exact content and nobody has edited the page since
+                        confluence_url = f"{settings.confluence_base_url}/spaces/{space_key}/pages/{existing_page['id']}"
 
-                # Check if page already exists
-                existing_pages = await confluence_client.search_pages(
-                    space_key=space_key, title=doc_title
-                )
+                        unchanged_msg = AIMessage(
+                            content=f"  ✅ Confluence page already up to date\n"
+                            f"  🔗 Page ID: {existing_page['id']}\n"
+                        )
+                        pending_msgs.append(unchanged_msg)
+                    elif existing_page:
+                        # Update existing page
+                        updated_page = await confluence_client.update_page(
+                            page_id=existing_page["id"],
+                            title=doc_title,
+                            content=doc_content,
+                            version=existing_page["version"],
+                        )
+                        confluence_url = f"{settings.confluence_base_url}/spaces/{space_key}/pages/{updated_page.id}"
+                        state["doc_page_version"] = updated_page.version
+                        page_cache[doc_title] = _page_entry(updated_page)
 
-                if existing_pages:
-                    # Update existing page
-                    existing_page = existing_pages[0]
-                    updated_page = await confluence_client.update_page(
-                        page_id=existing_page.id,
-                        title=doc_title,
-                        content=doc_content,
-                        version=existing_page.version,
-                    )
-                    confluence_url = f"{settings.confluence_base_url}/spaces/{space_key}/pages/{updated_page.id}"
+                        update_msg = AIMessage(
+                            content=f"  📝 Updated existing Confluence page\n"
+                            f"  🔗 Page ID: {updated_page.id}\n"
+                        )
+                        pending_msgs.append(update_msg)
+                    else:
+                        # Create new page
+                        new_page = await confluence_client.create_page(
+                            space_key=space_key, title=doc_title, content=doc_content
+                        )
+                        confluence_url = f"{settings.confluence_base_url}/spaces/{space_key}/pages/{new_page.id}"
+                        state["doc_page_version"] = new_page.version
+                        page_cache[doc_title] = _page_entry(new_page)
 
-                    update_msg = AIMessage(
-                        content=f"  📝 Updated existing Confluence page\n"
-                        f"  🔗 Page ID: {updated_page.id}\n"
-                    )
-                    state["messages"] = add_messages(state["messages"], [update_msg])
-                else:
-                    # Create new page
-                    new_page = await confluence_client.create_page(
-                        space_key=space_key, title=doc_title, content=doc_content
-                    )
-                    confluence_url = f"{settings.confluence_base_url}/spaces/{space_key}/pages/{new_page.id}"
+                        create_msg = AIMessage(
+                            content=f"  📄 Created new Confluence page\n"
+                            f"  🔗 Page ID: {new_page.id}\n"
+                        )
+                        pending_msgs.append(create_msg)
 
-                    create_msg = AIMessage(
-                        content=f"  📄 Created new Confluence page\n"
-                        f"  🔗 Page ID: {new_page.id}\n"
-                    )
-                    state["messages"] = add_messages(state["messages"], [create_msg])
+                    state["doc_cache_key"] = doc_key
+                    state["confluence_content_hash"] = content_hash
 
-            except Exception as api_error:
-                # Fall back to mock URL generation
-                mock_msg = AIMessage(
-                    content=f"  ⚠️  Confluence API error: {str(api_error)}\n"
-                    f"  🔧 Generating mock documentation URL...\n"
-                )
-                state["messages"] = add_messages(state["messages"], [mock_msg])
+                except Exception as api_error:
+                    # Fall back to mock URL generation
+                    mock_msg = AIMessage(
+                        content=f"  ⚠️  Confluence API error: {str(api_error)}\n"
+                        f"  🔧 Generating mock documentation URL...\n"
+                    )
+                    pending_msgs.append(mock_msg)
 
-                settings = get_settings()
-                confluence_url = f"{settings.confluence_base_url}/wiki/spaces/DEV/pages/123456/Release+{state['fix_version'].replace('.', '-')}"
+                    settings = get_settings()
+                    confluence_url = f"{settings.confluence_base_url}/wiki/spaces/DEV/pages/123456/Release+{state['fix_version'].replace('.', '-')}"
 
             state["confluence_url"] = confluence_url
 
@@ -1725,9 +2373,10 @@ def create_release_workflow() -> StateGraph:
                 f"• Rollback procedures and emergency instructions\n"
                 f"• Complete branch and version information\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [doc_msg])
+            pending_msgs.append(doc_msg)
+            _append_messages(state, pending_msgs)
 
-            state["steps_completed"].append("documentation")
+            _mark_step_completed(state, "documentation")
             return state
 
         except Exception as e:
@@ -1754,13 +2403,14 @@ def create_release_workflow() -> StateGraph:
             f"📋 **Completed steps:** {', '.join(state.get('steps_completed', []))}\n"
             f"❌ **Failed steps:** {', '.join(state.get('steps_failed', []))}\n\n"
         )
-        state["messages"] = add_messages(state["messages"], [recovery_msg])
+        pending_msgs: List[AIMessage] = [recovery_msg]
 
         # Auto-recover by clearing error and resuming from the failed step
         if retry_count < 3:
             state["retry_count"] = retry_count + 1
             state["error"] = ""
             state["error_step"] = ""
+            state["github_auth_failure"] = ""
             state["can_continue"] = True
             
             # Resume from the failed step instead of continuing to next
@@ -1776,7 +2426,7 @@ def create_release_workflow() -> StateGraph:
                     content=f"✅ **Auto-recovery attempt {retry_count + 1}** - resuming from step '{error_step}'...\n\n"
                 )
             
-            state["messages"] = add_messages(state["messages"], [recovery_msg])
+            pending_msgs.append(recovery_msg)
         else:
             state["can_continue"] = False
             state["workflow_complete"] = True
@@ -1784,8 +2434,9 @@ def create_release_workflow() -> StateGraph:
             fail_msg = AIMessage(
                 content="❌ **Maximum retry attempts reached** - workflow failed.\n\n"
             )
-            state["messages"] = add_messages(state["messages"], [fail_msg])
+            pending_msgs.append(fail_msg)
 
+        _append_messages(state, pending_msgs)
         return state
 
     @log_workflow_function(level=LogLevel.INFO, include_state=True, include_result=False, include_execution_time=True, log_errors=True)
@@ -1793,6 +2444,10 @@ def create_release_workflow() -> StateGraph:
         """Final step: Complete the workflow."""
         state["current_step"] = "complete"
         state["workflow_complete"] = True
+        state["tag_cache"] = {}
+        state["branch_cache"] = {}
+        _discard_branch_prefetch(state)
+        _discard_doc_page_prefetch(state)
 
         # Final summary
         completed_steps = state.get("steps_completed", [])
@@ -1817,7 +2472,7 @@ def create_release_workflow() -> StateGraph:
             "3. Monitor deployment status\n"
             "4. Use rollback branches if needed\n"
         )
-        state["messages"] = add_messages(state["messages"], [summary_msg])
+        _append_messages(state, [summary_msg])
 
         return state
 
@@ -1842,128 +2497,78 @@ def create_release_workflow() -> StateGraph:
     workflow.set_entry_point("start")
 
     # Add conditional edges for error routing and workflow control
-    workflow.add_conditional_edges(
-        "start",
-        should_continue_workflow,
-        {
-            "jira_collection": "jira_collection",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
+    for step in _PIPELINE:
+        next_step = _STEP_FLOW[step]
+        workflow.add_conditional_edges(
+            step,
+            should_continue_workflow,
+            {next_step: next_step, "error_handler": "error_handler", "complete": "complete"},
+        )
 
+    # Error handler can either resume any step after start or complete
     workflow.add_conditional_edges(
-        "jira_collection",
+        "error_handler",
         should_continue_workflow,
-        {
-            "branch_discovery": "branch_discovery",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
+        {step: step for step in _PIPELINE[1:]} | {"complete": "complete"},
     )
 
-    workflow.add_conditional_edges(
-        "branch_discovery",
-        should_continue_workflow,
-        {
-            "merge_validation": "merge_validation",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
+    # Complete workflow terminates
+    workflow.add_edge("complete", END)
 
-    workflow.add_conditional_edges(
-        "merge_validation",
-        should_continue_workflow,
-        {
-            "sprint_merging": "sprint_merging",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
+    return workflow
 
-    workflow.add_conditional_edges(
-        "sprint_merging",
-        should_continue_workflow,
-        {
-            "release_creation": "release_creation",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
 
-    workflow.add_conditional_edges(
-        "release_creation",
-        should_continue_workflow,
-        {
-            "pr_generation": "pr_generation",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
+# Durable checkpointer shared by every graph compiled while the app is running
+_durable_checkpointer: Optional[BaseCheckpointSaver] = None
 
-    workflow.add_conditional_edges(
-        "pr_generation",
-        should_continue_workflow,
-        {
-            "release_tagging": "release_tagging",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
 
-    workflow.add_conditional_edges(
-        "release_tagging",
-        should_continue_workflow,
-        {
-            "rollback_preparation": "rollback_preparation",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
+def _checkpoint_serde() -> JsonPlusSerializer:
+    """Return the checkpoint serializer; state is msgpack-encoded, never pickled."""
+    return JsonPlusSerializer(pickle_fallback=False)
 
-    workflow.add_conditional_edges(
-        "rollback_preparation",
-        should_continue_workflow,
-        {
-            "documentation": "documentation",
-            "error_handler": "error_handler",
-            "complete": "complete",
-        },
-    )
 
-    workflow.add_conditional_edges(
-        "documentation",
-        should_continue_workflow,
-        {"complete": "complete", "error_handler": "error_handler"},
-    )
+@asynccontextmanager
+async def open_workflow_checkpointer() -> AsyncIterator[Optional[BaseCheckpointSaver]]:
+    """Open the durable checkpointer for the lifetime of the application.
 
-    # Error handler can either continue or complete
-    workflow.add_conditional_edges(
-        "error_handler",
-        should_continue_workflow,
-        {
-            "jira_collection": "jira_collection",
-            "branch_discovery": "branch_discovery",
-            "merge_validation": "merge_validation",
-            "sprint_merging": "sprint_merging",
-            "release_creation": "release_creation",
-            "pr_generation": "pr_generation",
-            "release_tagging": "release_tagging",
-            "rollback_preparation": "rollback_preparation",
-            "documentation": "documentation",
-            "complete": "complete",
-        },
-    )
+    Yields None when no checkpoint path is configured. Release graphs created
+    while it is open share its single SQLite connection, which is closed on exit.
+    """
+    global _durable_checkpointer
+    checkpoint_path = get_settings().workflow_checkpoint_path
+    if not checkpoint_path:
+        yield None
+        return
+
+    # Durable checkpoints let completed steps survive a restart; the saver
+    # switches the database to WAL journaling when it sets up its tables
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    Path(checkpoint_path).parent.mkdir(parents=True, exist_ok=True)
+    # Same as AsyncSqliteSaver.from_conn_string, which cannot take a serializer
+    async with aiosqlite.connect(checkpoint_path) as conn:
+        _durable_checkpointer = AsyncSqliteSaver(conn, serde=_checkpoint_serde())
+        try:
+            yield _durable_checkpointer
+        finally:
+            _durable_checkpointer = None
 
-    # Complete workflow terminates
-    workflow.add_edge("complete", END)
 
+def create_release_workflow(
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+) -> StateGraph:
+    """Create and configure the release automation workflow.
+
+    Uses the given checkpointer, else the one opened by
+    open_workflow_checkpointer, else an in-memory saver.
+    """
     # Create checkpointer for interrupt support
-    checkpointer = MemorySaver()
+    if checkpointer is None:
+        checkpointer = _durable_checkpointer or MemorySaver(serde=_checkpoint_serde())
 
     # Compile with streaming support, error handling, and interrupt support
-    return workflow.compile(checkpointer=checkpointer)
+    return _build_release_graph().compile(checkpointer=checkpointer)
 
 
 def extract_workflow_params(request: ChatRequest) -> Dict[str, Any]:
@@ -5,8 +5,15 @@ This package contains tool definitions for various API integrations
 that can be used in LangGraph workflows.
 """
 
-from .github_tools import GitHubTools
-from .jira_tools import JiraTools
-from .confluence_tools import ConfluenceTools
+from .github_tools import GitHubTools, get_github_tools
+from .jira_tools import JiraTools, get_jira_tools
+from .confluence_tools import ConfluenceTools, get_confluence_tools
 
-__all__ = ["GitHubTools", "JiraTools", "ConfluenceTools"] 
\ No newline at end of file
+__all__ = [
+    "GitHubTools",
+    "JiraTools",
+    "ConfluenceTools",
+    "get_github_tools",
+    "get_jira_tools",
+    "get_confluence_tools",
+] 
\ No newline at end of file
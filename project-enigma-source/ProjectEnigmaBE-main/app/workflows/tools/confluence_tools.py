@@ -5,18 +5,40 @@ This module provides tools for Confluence operations that can be used
 in LangGraph workflows, wrapping the Confluence interface methods.
 """
 
-import asyncio
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from app.integrations.factory import create_api_clients
+from app.integrations.factory import get_api_clients
+
+from .result_cache import TTLCache
+from .result_encoding import offload_large_result
+from .sync_runner import run_sync
+
+# Seconds read-only lookups stay cached between tool calls
+_SPACES_TTL = 300
+_CONNECTION_TTL = 300
+
+# ConfluencePage fields returned by the page tools
+_PAGE_FIELDS = {
+    "id",
+    "title",
+    "space_key",
+    "url",
+    "content",
+    "created_at",
+    "updated_at",
+    "author",
+    "version",
+}
+_PAGE_METADATA_FIELDS = _PAGE_FIELDS - {"content"}
 
 
 class GetSpacesInput(BaseModel):
     """Input for getting all accessible spaces."""
-    pass
+    limit: Optional[int] = Field(default=None, ge=1, description="Optional maximum number of spaces to return")
 
 
 class GetPageInput(BaseModel):
@@ -44,6 +66,10 @@ class SearchPagesInput(BaseModel):
     """Input for searching pages in a space."""
     space_key: str = Field(description="Confluence space key")
     title: Optional[str] = Field(default=None, description="Optional title to search for")
+    include_content: bool = Field(
+        default=False,
+        description="Include each page's full content; use get_page to fetch a single body instead",
+    )
 
 
 class DeletePageInput(BaseModel):
@@ -68,13 +94,21 @@ class ConfluenceTools:
 
     def __init__(self, use_mock: bool = True):
         """Initialize Confluence tools with API clients."""
-        self.clients = create_api_clients(use_mock=use_mock)
+        self.clients = get_api_clients(use_mock=use_mock)
         self.confluence_client = self.clients.confluence
+        self._tools: Optional[List[BaseTool]] = None
+        self._authenticated = False
+        self._cache = TTLCache()
 
     async def _ensure_authenticated(self):
         """Ensure Confluence client is authenticated."""
-        if not hasattr(self.confluence_client, '_authenticated') or not self.confluence_client._authenticated:
-            await self.confluence_client.authenticate()
+        if self._authenticated:
+            return
+        # Concurrent callers, on whichever loop they run, share one in-flight
+        # authentication; a ttl of zero keeps a failed attempt from sticking
+        self._authenticated = await self._cache.get_or_load(
+            ("auth",), 0, self.confluence_client.authenticate
+        )
 
     class GetSpacesTool(BaseTool):
         """Tool for getting all accessible spaces."""
@@ -86,15 +120,18 @@ class ConfluenceTools:
         def __init__(self, confluence_tools_instance):
             super().__init__(confluence_tools=confluence_tools_instance)
 
-        def _run(self) -> Dict[str, Any]:
+        def _run(self, limit: Optional[int] = None) -> Dict[str, Any]:
             """Get spaces (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun())
+            return run_sync(self._arun(limit))
 
-        async def _arun(self) -> Dict[str, Any]:
+        async def _arun(self, limit: Optional[int] = None) -> Dict[str, Any]:
             """Get all accessible spaces."""
             await self.confluence_tools._ensure_authenticated()
-            spaces = await self.confluence_tools.confluence_client.get_spaces()
+            spaces = await self.confluence_tools._cache.get_or_load(
+                ("spaces",),
+                _SPACES_TTL,
+                self.confluence_tools.confluence_client.get_spaces,
+            )
             return {
                 "space_count": len(spaces),
                 "spaces": [
@@ -105,7 +142,7 @@ class ConfluenceTools:
                         "url": space.url,
                         "type": space.type
                     }
-                    for space in spaces
+                    for space in spaces[:limit]
                 ]
             }
 
@@ -119,30 +156,24 @@ class ConfluenceTools:
         def __init__(self, confluence_tools_instance):
             super().__init__(confluence_tools=confluence_tools_instance)
 
-        def _run(self, page_id: str) -> Dict[str, Any]:
+        def _run(self, page_id: str) -> Union[Dict[str, Any], str]:
             """Get a specific page (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(page_id))
+            return run_sync(self._arun(page_id))
 
-        async def _arun(self, page_id: str) -> Dict[str, Any]:
+        async def _arun(self, page_id: str) -> Union[Dict[str, Any], str]:
             """Get a specific page."""
             await self.confluence_tools._ensure_authenticated()
-            page = await self.confluence_tools.confluence_client.get_page(page_id)
+            # Pages change often; only share lookups that are already in flight
+            page = await self.confluence_tools._cache.get_or_load(
+                ("page", page_id),
+                0,
+                lambda: self.confluence_tools.confluence_client.get_page(page_id),
+            )
             if page:
-                return {
-                    "found": True,
-                    "page": {
-                        "id": page.id,
-                        "title": page.title,
-                        "space_key": page.space_key,
-                        "url": page.url,
-                        "content": page.content,
-                        "created_at": page.created_at,
-                        "updated_at": page.updated_at,
-                        "author": page.author,
-                        "version": page.version
-                    }
-                }
+                return await offload_large_result(
+                    {"found": True, "page": page.model_dump(include=_PAGE_FIELDS)},
+                    len(page.content or ""),
+                )
             else:
                 return {"found": False, "error": f"Page '{page_id}' not found"}
 
@@ -156,29 +187,18 @@ class ConfluenceTools:
         def __init__(self, confluence_tools_instance):
             super().__init__(confluence_tools=confluence_tools_instance)
 
-        def _run(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None) -> Dict[str, Any]:
+        def _run(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None) -> Union[Dict[str, Any], str]:
             """Create a new page (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(space_key, title, content, parent_id))
+            return run_sync(self._arun(space_key, title, content, parent_id))
 
-        async def _arun(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None) -> Dict[str, Any]:
+        async def _arun(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None) -> Union[Dict[str, Any], str]:
             """Create a new page."""
             await self.confluence_tools._ensure_authenticated()
             page = await self.confluence_tools.confluence_client.create_page(space_key, title, content, parent_id)
-            return {
-                "created": True,
-                "page": {
-                    "id": page.id,
-                    "title": page.title,
-                    "space_key": page.space_key,
-                    "url": page.url,
-                    "content": page.content,
-                    "created_at": page.created_at,
-                    "updated_at": page.updated_at,
-                    "author": page.author,
-                    "version": page.version
-                }
-            }
+            return await offload_large_result(
+                {"created": True, "page": page.model_dump(include=_PAGE_FIELDS)},
+                len(page.content or ""),
+            )
 
     class UpdatePageTool(BaseTool):
         """Tool for updating an existing page."""
@@ -190,68 +210,57 @@ class ConfluenceTools:
         def __init__(self, confluence_tools_instance):
             super().__init__(confluence_tools=confluence_tools_instance)
 
-        def _run(self, page_id: str, title: str, content: str, version: int) -> Dict[str, Any]:
+        def _run(self, page_id: str, title: str, content: str, version: int) -> Union[Dict[str, Any], str]:
             """Update an existing page (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(page_id, title, content, version))
+            return run_sync(self._arun(page_id, title, content, version))
 
-        async def _arun(self, page_id: str, title: str, content: str, version: int) -> Dict[str, Any]:
+        async def _arun(self, page_id: str, title: str, content: str, version: int) -> Union[Dict[str, Any], str]:
             """Update an existing page."""
             await self.confluence_tools._ensure_authenticated()
             page = await self.confluence_tools.confluence_client.update_page(page_id, title, content, version)
-            return {
-                "updated": True,
-                "page": {
-                    "id": page.id,
-                    "title": page.title,
-                    "space_key": page.space_key,
-                    "url": page.url,
-                    "content": page.content,
-                    "created_at": page.created_at,
-                    "updated_at": page.updated_at,
-                    "author": page.author,
-                    "version": page.version
-                }
-            }
+            return await offload_large_result(
+                {"updated": True, "page": page.model_dump(include=_PAGE_FIELDS)},
+                len(page.content or ""),
+            )
 
     class SearchPagesTool(BaseTool):
         """Tool for searching pages in a space."""
         name: str = "search_pages"
-        description: str = "Search for pages in a Confluence space"
+        description: str = "Search for pages in a Confluence space (metadata only unless include_content is set)"
         args_schema: type = SearchPagesInput
         confluence_tools: Any = None
 
         def __init__(self, confluence_tools_instance):
             super().__init__(confluence_tools=confluence_tools_instance)
 
-        def _run(self, space_key: str, title: Optional[str] = None) -> Dict[str, Any]:
+        def _run(self, space_key: str, title: Optional[str] = None, include_content: bool = False) -> Union[Dict[str, Any], str]:
             """Search pages (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(space_key, title))
+            return run_sync(self._arun(space_key, title, include_content))
 
-        async def _arun(self, space_key: str, title: Optional[str] = None) -> Dict[str, Any]:
+        async def _arun(self, space_key: str, title: Optional[str] = None, include_content: bool = False) -> Union[Dict[str, Any], str]:
             """Search for pages in a space."""
             await self.confluence_tools._ensure_authenticated()
-            pages = await self.confluence_tools.confluence_client.search_pages(space_key, title)
-            return {
+            pages = await self.confluence_tools._cache.get_or_load(
+                ("search", space_key, title, include_content),
+                0,
+                lambda: self.confluence_tools.confluence_client.search_pages(
+                    space_key, title, include_content=include_content
+                ),
+            )
+            fields = _PAGE_FIELDS if include_content else _PAGE_METADATA_FIELDS
+            result = {
                 "space_key": space_key,
                 "title_filter": title,
                 "page_count": len(pages),
                 "pages": [
-                    {
-                        "id": page.id,
-                        "title": page.title,
-                        "space_key": page.space_key,
-                        "url": page.url,
-                        "content": page.content,
-                        "created_at": page.created_at,
-                        "updated_at": page.updated_at,
-                        "author": page.author,
-                        "version": page.version
-                    }
-                    for page in pages
+                    page.model_dump(include=fields) for page in pages
                 ]
             }
+            if not include_content:
+                return result
+            return await offload_large_result(
+                result, sum(len(page.content or "") for page in pages)
+            )
 
     class DeletePageTool(BaseTool):
         """Tool for deleting a page."""
@@ -265,8 +274,7 @@ class ConfluenceTools:
 
         def _run(self, page_id: str) -> Dict[str, Any]:
             """Delete a page (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(page_id))
+            return run_sync(self._arun(page_id))
 
         async def _arun(self, page_id: str) -> Dict[str, Any]:
             """Delete a page."""
@@ -287,31 +295,23 @@ class ConfluenceTools:
         def __init__(self, confluence_tools_instance):
             super().__init__(confluence_tools=confluence_tools_instance)
 
-        def _run(self, space_key: str, release_version: str, repositories: List[Dict[str, Any]]) -> Dict[str, Any]:
+        def _run(self, space_key: str, release_version: str, repositories: List[Dict[str, Any]]) -> Union[Dict[str, Any], str]:
             """Create deployment page (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(space_key, release_version, repositories))
+            return run_sync(self._arun(space_key, release_version, repositories))
 
-        async def _arun(self, space_key: str, release_version: str, repositories: List[Dict[str, Any]]) -> Dict[str, Any]:
+        async def _arun(self, space_key: str, release_version: str, repositories: List[Dict[str, Any]]) -> Union[Dict[str, Any], str]:
             """Create a deployment documentation page."""
             await self.confluence_tools._ensure_authenticated()
             page = await self.confluence_tools.confluence_client.create_deployment_page(space_key, release_version, repositories)
-            return {
-                "created": True,
-                "page": {
-                    "id": page.id,
-                    "title": page.title,
-                    "space_key": page.space_key,
-                    "url": page.url,
-                    "content": page.content,
-                    "created_at": page.created_at,
-                    "updated_at": page.updated_at,
-                    "author": page.author,
-                    "version": page.version
+            return await offload_large_result(
+                {
+                    "created": True,
+                    "page": page.model_dump(include=_PAGE_FIELDS),
+                    "release_version": release_version,
+                    "repository_count": len(repositories)
                 },
-                "release_version": release_version,
-                "repository_count": len(repositories)
-            }
+                len(page.content or ""),
+            )
 
     class ValidateConnectionTool(BaseTool):
         """Tool for validating Confluence connection."""
@@ -325,13 +325,16 @@ class ConfluenceTools:
 
         def _run(self) -> Dict[str, Any]:
             """Validate Confluence connection (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun())
+            return run_sync(self._arun())
 
         async def _arun(self) -> Dict[str, Any]:
             """Validate Confluence connection."""
             await self.confluence_tools._ensure_authenticated()
-            connection_info = await self.confluence_tools.confluence_client.validate_connection()
+            connection_info = await self.confluence_tools._cache.get_or_load(
+                ("connection",),
+                _CONNECTION_TTL,
+                self.confluence_tools.confluence_client.validate_connection,
+            )
             return {
                 "status": "connected",
                 "connection_info": connection_info
@@ -339,13 +342,22 @@ class ConfluenceTools:
 
     def get_tools(self) -> List[BaseTool]:
         """Get all Confluence tools."""
-        return [
-            self.GetSpacesTool(self),
-            self.GetPageTool(self),
-            self.CreatePageTool(self),
-            self.UpdatePageTool(self),
-            self.SearchPagesTool(self),
-            self.DeletePageTool(self),
-            self.CreateDeploymentPageTool(self),
-            self.ValidateConnectionTool(self),
-        ] 
\ No newline at end of file
+        # Tools are stateless wrappers around this instance, so build them once
+        if self._tools is None:
+            self._tools = [
+                self.GetSpacesTool(self),
+                self.GetPageTool(self),
+                self.CreatePageTool(self),
+                self.UpdatePageTool(self),
+                self.SearchPagesTool(self),
+                self.DeletePageTool(self),
+                self.CreateDeploymentPageTool(self),
+                self.ValidateConnectionTool(self),
+            ]
+        return list(self._tools)
+
+
+@lru_cache(maxsize=None)
+def get_confluence_tools(use_mock: bool = True) -> ConfluenceTools:
+    """Get the Confluence tools shared across the process."""
+    return ConfluenceTools(use_mock=use_mock)
@@ -5,13 +5,70 @@ This module provides tools for GitHub operations that can be used
 in LangGraph workflows, wrapping the GitHub interface methods.
 """
 
-import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from app.integrations.factory import create_api_clients
+from app.integrations.factory import get_api_clients
+
+from .result_cache import TTLCache
+from .sync_runner import run_sync
+
+# Seconds read-only lookups stay cached between tool calls
+_BRANCHES_TTL = 60
+_TAGS_TTL = 60
+_REPOSITORY_TTL = 300
+_CONNECTION_TTL = 300
+
+
+def _repository_info(repo) -> Dict[str, Any]:
+    """Tool representation of a GitHubRepository."""
+    return {
+        "name": repo.name,
+        "full_name": repo.full_name,
+        "default_branch": repo.default_branch,
+        "url": repo.url,
+        "clone_url": repo.clone_url,
+        "private": repo.private
+    }
+
+
+def _branches_result(repo_name: str, branches) -> Dict[str, Any]:
+    """Tool result for a repository's branches."""
+    return {
+        "repository": repo_name,
+        "branch_count": len(branches),
+        "branches": [
+            {
+                "name": branch.name,
+                "sha": branch.sha,
+                "protected": branch.protected,
+                "url": branch.url
+            }
+            for branch in branches
+        ]
+    }
+
+
+def _tags_result(repo_name: str, tags, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Tool result for a repository's tags, truncated to limit entries."""
+    return {
+        "repository": repo_name,
+        "tag_count": len(tags),
+        "tags": [
+            {
+                "name": tag.name,
+                "sha": tag.sha,
+                "url": tag.url,
+                "tagger": tag.tagger,
+                "date": tag.date,
+                "message": tag.message
+            }
+            for tag in tags[:limit]
+        ]
+    }
 
 
 class GetRepositoryInput(BaseModel):
@@ -56,6 +113,7 @@ class MergePullRequestInput(BaseModel):
 class GetTagsInput(BaseModel):
     """Input for getting repository tags."""
     repo_name: str = Field(description="Repository name in format 'owner/repo' or just 'repo'")
+    limit: Optional[int] = Field(default=None, ge=1, description="Optional maximum number of tags to return")
 
 
 class CreateTagInput(BaseModel):
@@ -66,6 +124,13 @@ class CreateTagInput(BaseModel):
     message: str = Field(description="Tag message")
 
 
+class GetRepositoryBundleInput(BaseModel):
+    """Input for getting a repository together with its branches and tags."""
+    repo_name: str = Field(description="Repository name in format 'owner/repo' or just 'repo'")
+    include_branches: bool = Field(default=True, description="Include the repository's branches")
+    include_tags: bool = Field(default=True, description="Include the repository's tags")
+
+
 class ValidateConnectionInput(BaseModel):
     """Input for validating GitHub connection."""
     pass
@@ -76,13 +141,21 @@ class GitHubTools:
 
     def __init__(self, use_mock: bool = True):
         """Initialize GitHub tools with API clients."""
-        self.clients = create_api_clients(use_mock=use_mock)
+        self.clients = get_api_clients(use_mock=use_mock)
         self.github_client = self.clients.github
+        self._tools: Optional[List[BaseTool]] = None
+        self._authenticated = False
+        self._cache = TTLCache()
 
     async def _ensure_authenticated(self):
         """Ensure GitHub client is authenticated."""
-        if not hasattr(self.github_client, '_authenticated') or not self.github_client._authenticated:
-            await self.github_client.authenticate()
+        if self._authenticated:
+            return
+        # Concurrent callers, on whichever loop they run, share one in-flight
+        # authentication; a ttl of zero keeps a failed attempt from sticking
+        self._authenticated = await self._cache.get_or_load(
+            ("auth",), 0, self.github_client.authenticate
+        )
 
     class GetRepositoryTool(BaseTool):
         """Tool for getting repository information."""
@@ -96,25 +169,18 @@ class GitHubTools:
 
         def _run(self, repo_name: str) -> Dict[str, Any]:
             """Get repository information (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(repo_name))
+            return run_sync(self._arun(repo_name))
 
         async def _arun(self, repo_name: str) -> Dict[str, Any]:
             """Get repository information."""
             await self.github_tools._ensure_authenticated()
-            repo = await self.github_tools.github_client.get_repository(repo_name)
+            repo = await self.github_tools._cache.get_or_load(
+                ("repository", repo_name),
+                _REPOSITORY_TTL,
+                lambda: self.github_tools.github_client.get_repository(repo_name),
+            )
             if repo:
-                return {
-                    "found": True,
-                    "repository": {
-                        "name": repo.name,
-                        "full_name": repo.full_name,
-                        "default_branch": repo.default_branch,
-                        "url": repo.url,
-                        "clone_url": repo.clone_url,
-                        "private": repo.private
-                    }
-                }
+                return {"found": True, "repository": _repository_info(repo)}
             else:
                 return {"found": False, "error": f"Repository '{repo_name}' not found"}
 
@@ -130,26 +196,17 @@ class GitHubTools:
 
         def _run(self, repo_name: str) -> Dict[str, Any]:
             """Get repository branches (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(repo_name))
+            return run_sync(self._arun(repo_name))
 
         async def _arun(self, repo_name: str) -> Dict[str, Any]:
             """Get repository branches."""
             await self.github_tools._ensure_authenticated()
-            branches = await self.github_tools.github_client.get_branches(repo_name)
-            return {
-                "repository": repo_name,
-                "branch_count": len(branches),
-                "branches": [
-                    {
-                        "name": branch.name,
-                        "sha": branch.sha,
-                        "protected": branch.protected,
-                        "url": branch.url
-                    }
-                    for branch in branches
-                ]
-            }
+            branches = await self.github_tools._cache.get_or_load(
+                ("branches", repo_name),
+                _BRANCHES_TTL,
+                lambda: self.github_tools.github_client.get_branches(repo_name),
+            )
+            return _branches_result(repo_name, branches)
 
     class FindFeatureBranchesTool(BaseTool):
         """Tool for finding feature branches by JIRA ticket IDs."""
@@ -163,13 +220,17 @@ class GitHubTools:
 
         def _run(self, repo_name: str, ticket_ids: List[str]) -> Dict[str, Any]:
             """Find feature branches for ticket IDs (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(repo_name, ticket_ids))
+            return run_sync(self._arun(repo_name, ticket_ids))
 
         async def _arun(self, repo_name: str, ticket_ids: List[str]) -> Dict[str, Any]:
             """Find feature branches for ticket IDs."""
             await self.github_tools._ensure_authenticated()
-            branches = await self.github_tools.github_client.find_feature_branches(repo_name, ticket_ids)
+            # Only share lookups that are already in flight
+            branches = await self.github_tools._cache.get_or_load(
+                ("feature_branches", repo_name, tuple(ticket_ids)),
+                0,
+                lambda: self.github_tools.github_client.find_feature_branches(repo_name, ticket_ids),
+            )
             return {
                 "repository": repo_name,
                 "ticket_ids": ticket_ids,
@@ -196,13 +257,16 @@ class GitHubTools:
 
         def _run(self, repo_name: str, source_branch: str, target_branch: str) -> Dict[str, Any]:
             """Check merge status between branches (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(repo_name, source_branch, target_branch))
+            return run_sync(self._arun(repo_name, source_branch, target_branch))
 
         async def _arun(self, repo_name: str, source_branch: str, target_branch: str) -> Dict[str, Any]:
             """Check merge status between branches."""
             await self.github_tools._ensure_authenticated()
-            status = await self.github_tools.github_client.check_merge_status(repo_name, source_branch, target_branch)
+            status = await self.github_tools._cache.get_or_load(
+                ("merge_status", repo_name, source_branch, target_branch),
+                0,
+                lambda: self.github_tools.github_client.check_merge_status(repo_name, source_branch, target_branch),
+            )
             return {
                 "repository": repo_name,
                 "source_branch": source_branch,
@@ -220,30 +284,59 @@ class GitHubTools:
         def __init__(self, github_tools_instance):
             super().__init__(github_tools=github_tools_instance)
 
-        def _run(self, repo_name: str) -> Dict[str, Any]:
+        def _run(self, repo_name: str, limit: Optional[int] = None) -> Dict[str, Any]:
             """Get repository tags (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(repo_name))
+            return run_sync(self._arun(repo_name, limit))
 
-        async def _arun(self, repo_name: str) -> Dict[str, Any]:
+        async def _arun(self, repo_name: str, limit: Optional[int] = None) -> Dict[str, Any]:
             """Get repository tags."""
             await self.github_tools._ensure_authenticated()
-            tags = await self.github_tools.github_client.get_tags(repo_name)
-            return {
-                "repository": repo_name,
-                "tag_count": len(tags),
-                "tags": [
-                    {
-                        "name": tag.name,
-                        "sha": tag.sha,
-                        "url": tag.url,
-                        "tagger": tag.tagger,
-                        "date": tag.date,
-                        "message": tag.message
-                    }
-                    for tag in tags
-                ]
+            tags = await self.github_tools._cache.get_or_load(
+                ("tags", repo_name),
+                _TAGS_TTL,
+                lambda: self.github_tools.github_client.get_tags(repo_name),
+            )
+            return _tags_result(repo_name, tags, limit)
+
+    class GetRepositoryBundleTool(BaseTool):
+        """Tool for getting a repository with its branches and tags in one lookup."""
+        name: str = "get_repository_bundle"
+        description: str = (
+            "Get information about a GitHub repository together with its branches "
+            "and tags in a single call; prefer this over separate lookups"
+        )
+        args_schema: type = GetRepositoryBundleInput
+        github_tools: Any = None
+
+        def __init__(self, github_tools_instance):
+            super().__init__(github_tools=github_tools_instance)
+
+        def _run(self, repo_name: str, include_branches: bool = True, include_tags: bool = True) -> Dict[str, Any]:
+            """Get repository bundle (synchronous)."""
+            return run_sync(self._arun(repo_name, include_branches, include_tags))
+
+        async def _arun(self, repo_name: str, include_branches: bool = True, include_tags: bool = True) -> Dict[str, Any]:
+            """Get a repository with its branches and tags."""
+            await self.github_tools._ensure_authenticated()
+            bundle = await self.github_tools._cache.get_or_load(
+                ("bundle", repo_name, include_branches, include_tags),
+                _BRANCHES_TTL,
+                lambda: self.github_tools.github_client.get_repository_bundle(
+                    repo_name, include_branches, include_tags
+                ),
+            )
+            if bundle is None:
+                return {"found": False, "error": f"Repository '{repo_name}' not found"}
+
+            result: Dict[str, Any] = {
+                "found": True,
+                "repository": _repository_info(bundle.repository),
             }
+            if bundle.branches is not None:
+                result["branches"] = _branches_result(repo_name, bundle.branches)
+            if bundle.tags is not None:
+                result["tags"] = _tags_result(repo_name, bundle.tags)
+            return result
 
     class ValidateConnectionTool(BaseTool):
         """Tool for validating GitHub connection."""
@@ -257,13 +350,16 @@ class GitHubTools:
 
         def _run(self) -> Dict[str, Any]:
             """Validate GitHub connection (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun())
+            return run_sync(self._arun())
 
         async def _arun(self) -> Dict[str, Any]:
             """Validate GitHub connection."""
             await self.github_tools._ensure_authenticated()
-            connection_info = await self.github_tools.github_client.validate_connection()
+            connection_info = await self.github_tools._cache.get_or_load(
+                ("connection",),
+                _CONNECTION_TTL,
+                self.github_tools.github_client.validate_connection,
+            )
             return {
                 "status": "connected",
                 "connection_info": connection_info
@@ -271,11 +367,21 @@ class GitHubTools:
 
     def get_tools(self) -> List[BaseTool]:
         """Get all GitHub tools."""
-        return [
-            self.GetRepositoryTool(self),
-            self.GetBranchesTool(self),
-            self.FindFeatureBranchesTool(self),
-            self.CheckMergeStatusTool(self),
-            self.GetTagsTool(self),
-            self.ValidateConnectionTool(self),
-        ] 
\ No newline at end of file
+        # Tools are stateless wrappers around this instance, so build them once
+        if self._tools is None:
+            self._tools = [
+                self.GetRepositoryTool(self),
+                self.GetBranchesTool(self),
+                self.FindFeatureBranchesTool(self),
+                self.CheckMergeStatusTool(self),
+                self.GetTagsTool(self),
+                self.GetRepositoryBundleTool(self),
+                self.ValidateConnectionTool(self),
+            ]
+        return list(self._tools)
+
+
+@lru_cache(maxsize=None)
+def get_github_tools(use_mock: bool = True) -> GitHubTools:
+    """Get the GitHub tools shared across the process."""
+    return GitHubTools(use_mock=use_mock)
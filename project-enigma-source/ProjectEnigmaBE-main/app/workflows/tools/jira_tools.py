@@ -6,12 +6,51 @@ in LangGraph workflows, wrapping the Jira interface methods.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from app.integrations.factory import create_api_clients
+from app.integrations.factory import get_api_clients
+
+from .result_cache import TTLCache
+from .result_encoding import offload_large_result
+from .sync_runner import run_in_background, run_sync
+
+# Maximum ticket lookups a batch keeps in flight at once
+_BATCH_CONCURRENCY = 16
+
+# Seconds read-only lookups stay cached between tool calls
+_TICKET_TTL = 60
+_PROJECTS_TTL = 300
+_CONNECTION_TTL = 300
+
+
+# JiraTicket fields returned by the ticket tools
+_TICKET_FIELDS = {
+    "key",
+    "summary",
+    "status",
+    "assignee",
+    "fix_version",
+    "issue_type",
+    "created",
+    "updated",
+    "description",
+    "project_key",
+}
+
+
+def _ticket_info(ticket) -> Dict[str, Any]:
+    """Tool representation of a JiraTicket."""
+    return ticket.model_dump(include=_TICKET_FIELDS)
+
+
+def _tickets_size_hint(tickets) -> int:
+    """Rough encoded size of a ticket list; descriptions dominate it."""
+    return sum(256 + len(ticket.description or "") for ticket in tickets)
 
 
 class GetTicketsByFixVersionInput(BaseModel):
@@ -25,6 +64,11 @@ class GetTicketInput(BaseModel):
     ticket_key: str = Field(description="Jira ticket key (e.g., 'PROJ-123')")
 
 
+class BatchGetTicketsInput(BaseModel):
+    """Input for getting several tickets at once."""
+    ticket_keys: List[str] = Field(description="Jira ticket keys (e.g., ['PROJ-123', 'PROJ-124'])")
+
+
 class SearchTicketsInput(BaseModel):
     """Input for searching tickets using JQL."""
     jql: str = Field(description="JQL (Jira Query Language) search string")
@@ -46,13 +90,41 @@ class JiraTools:
 
     def __init__(self, use_mock: bool = True):
         """Initialize Jira tools with API clients."""
-        self.clients = create_api_clients(use_mock=use_mock)
+        self.clients = get_api_clients(use_mock=use_mock)
         self.jira_client = self.clients.jira
+        self._tools: Optional[List[BaseTool]] = None
+        self._authenticated = False
+        self._cache = TTLCache(max_entries=1024)
+
+        # Authenticate in the background on the shared tool loop, so the first
+        # tool call does not pay for it; failures surface on that call
+        self._warmup: Future = run_in_background(self._ensure_authenticated())
+        self._warmup.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
+        )
+
+    async def _get_ticket(self, ticket_key: str):
+        """Get a ticket through the shared TTL cache."""
+        return await self._cache.get_or_load(
+            ("ticket", ticket_key),
+            _TICKET_TTL,
+            lambda: self.jira_client.get_ticket(ticket_key),
+        )
+
+    def _remember_tickets(self, tickets) -> None:
+        """Seed the ticket cache from a bulk result so later get_ticket calls hit it."""
+        for ticket in tickets:
+            self._cache.put(("ticket", ticket.key), _TICKET_TTL, ticket)
 
     async def _ensure_authenticated(self):
         """Ensure Jira client is authenticated."""
-        if not hasattr(self.jira_client, '_authenticated') or not self.jira_client._authenticated:
-            await self.jira_client.authenticate()
+        if self._authenticated:
+            return
+        # Concurrent callers, on whichever loop they run, share one in-flight
+        # authentication; a ttl of zero keeps a failed attempt from sticking
+        self._authenticated = await self._cache.get_or_load(
+            ("auth",), 0, self.jira_client.authenticate
+        )
 
     class GetTicketsByFixVersionTool(BaseTool):
         """Tool for getting tickets by fix version."""
@@ -64,35 +136,26 @@ class JiraTools:
         def __init__(self, jira_tools_instance):
             super().__init__(jira_tools=jira_tools_instance)
 
-        def _run(self, fix_version: str, project_keys: Optional[List[str]] = None) -> Dict[str, Any]:
+        def _run(self, fix_version: str, project_keys: Optional[List[str]] = None) -> Union[Dict[str, Any], str]:
             """Get tickets by fix version (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(fix_version, project_keys))
+            return run_sync(self._arun(fix_version, project_keys))
 
-        async def _arun(self, fix_version: str, project_keys: Optional[List[str]] = None) -> Dict[str, Any]:
+        async def _arun(self, fix_version: str, project_keys: Optional[List[str]] = None) -> Union[Dict[str, Any], str]:
             """Get tickets by fix version."""
             await self.jira_tools._ensure_authenticated()
             tickets = await self.jira_tools.jira_client.get_tickets_by_fix_version(fix_version, project_keys)
-            return {
-                "fix_version": fix_version,
-                "project_keys": project_keys,
-                "ticket_count": len(tickets),
-                "tickets": [
-                    {
-                        "key": ticket.key,
-                        "summary": ticket.summary,
-                        "status": ticket.status,
-                        "assignee": ticket.assignee,
-                        "fix_version": ticket.fix_version,
-                        "issue_type": ticket.issue_type,
-                        "created": ticket.created,
-                        "updated": ticket.updated,
-                        "description": ticket.description,
-                        "project_key": ticket.project_key
-                    }
-                    for ticket in tickets
-                ]
-            }
+            self.jira_tools._remember_tickets(tickets)
+            return await offload_large_result(
+                {
+                    "fix_version": fix_version,
+                    "project_keys": project_keys,
+                    "ticket_count": len(tickets),
+                    "tickets": [
+                        _ticket_info(ticket) for ticket in tickets
+                    ]
+                },
+                _tickets_size_hint(tickets),
+            )
 
     class GetTicketTool(BaseTool):
         """Tool for getting a specific ticket."""
@@ -106,32 +169,64 @@ class JiraTools:
 
         def _run(self, ticket_key: str) -> Dict[str, Any]:
             """Get a specific ticket (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(ticket_key))
+            return run_sync(self._arun(ticket_key))
 
         async def _arun(self, ticket_key: str) -> Dict[str, Any]:
             """Get a specific ticket."""
             await self.jira_tools._ensure_authenticated()
-            ticket = await self.jira_tools.jira_client.get_ticket(ticket_key)
+            ticket = await self.jira_tools._get_ticket(ticket_key)
             if ticket:
                 return {
                     "found": True,
-                    "ticket": {
-                        "key": ticket.key,
-                        "summary": ticket.summary,
-                        "status": ticket.status,
-                        "assignee": ticket.assignee,
-                        "fix_version": ticket.fix_version,
-                        "issue_type": ticket.issue_type,
-                        "created": ticket.created,
-                        "updated": ticket.updated,
-                        "description": ticket.description,
-                        "project_key": ticket.project_key
-                    }
+                    "ticket": _ticket_info(ticket)
                 }
             else:
                 return {"found": False, "error": f"Ticket '{ticket_key}' not found"}
 
+    class BatchGetTicketsTool(BaseTool):
+        """Tool for getting several tickets concurrently."""
+        name: str = "batch_get_tickets"
+        description: str = "Get several Jira tickets by key in one call; prefer this over repeated get_ticket calls"
+        args_schema: type = BatchGetTicketsInput
+        jira_tools: Any = None
+
+        def __init__(self, jira_tools_instance):
+            super().__init__(jira_tools=jira_tools_instance)
+
+        def _run(self, ticket_keys: List[str]) -> Dict[str, Any]:
+            """Get several tickets (synchronous)."""
+            return run_sync(self._arun(ticket_keys))
+
+        async def _arun(self, ticket_keys: List[str]) -> Dict[str, Any]:
+            """Get several tickets, keeping a bounded number of lookups in flight."""
+            await self.jira_tools._ensure_authenticated()
+            keys = list(dict.fromkeys(ticket_keys))
+            semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+            async def _get_ticket(ticket_key: str):
+                async with semaphore:
+                    return await self.jira_tools._get_ticket(ticket_key)
+
+            # Lookup failures are reported per ticket
+            results = await asyncio.gather(
+                *(_get_ticket(key) for key in keys), return_exceptions=True
+            )
+
+            tickets: Dict[str, Any] = {}
+            errors: Dict[str, str] = {}
+            for key, result in zip(keys, results):
+                if isinstance(result, Exception):
+                    errors[key] = str(result)
+                    tickets[key] = None
+                else:
+                    tickets[key] = _ticket_info(result) if result else None
+            return {
+                "requested_count": len(keys),
+                "found_count": sum(ticket is not None for ticket in tickets.values()),
+                "tickets": tickets,
+                "errors": errors
+            }
+
     class SearchTicketsTool(BaseTool):
         """Tool for searching tickets using JQL."""
         name: str = "search_tickets"
@@ -142,35 +237,26 @@ class JiraTools:
         def __init__(self, jira_tools_instance):
             super().__init__(jira_tools=jira_tools_instance)
 
-        def _run(self, jql: str, max_results: int = 50) -> Dict[str, Any]:
+        def _run(self, jql: str, max_results: int = 50) -> Union[Dict[str, Any], str]:
             """Search tickets using JQL (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun(jql, max_results))
+            return run_sync(self._arun(jql, max_results))
 
-        async def _arun(self, jql: str, max_results: int = 50) -> Dict[str, Any]:
+        async def _arun(self, jql: str, max_results: int = 50) -> Union[Dict[str, Any], str]:
             """Search tickets using JQL."""
             await self.jira_tools._ensure_authenticated()
             tickets = await self.jira_tools.jira_client.search_tickets(jql, max_results)
-            return {
-                "jql": jql,
-                "max_results": max_results,
-                "ticket_count": len(tickets),
-                "tickets": [
-                    {
-                        "key": ticket.key,
-                        "summary": ticket.summary,
-                        "status": ticket.status,
-                        "assignee": ticket.assignee,
-                        "fix_version": ticket.fix_version,
-                        "issue_type": ticket.issue_type,
-                        "created": ticket.created,
-                        "updated": ticket.updated,
-                        "description": ticket.description,
-                        "project_key": ticket.project_key
-                    }
-                    for ticket in tickets
-                ]
-            }
+            self.jira_tools._remember_tickets(tickets)
+            return await offload_large_result(
+                {
+                    "jql": jql,
+                    "max_results": max_results,
+                    "ticket_count": len(tickets),
+                    "tickets": [
+                        _ticket_info(ticket) for ticket in tickets
+                    ]
+                },
+                _tickets_size_hint(tickets),
+            )
 
     class GetProjectsTool(BaseTool):
         """Tool for getting all accessible projects."""
@@ -184,13 +270,14 @@ class JiraTools:
 
         def _run(self) -> Dict[str, Any]:
             """Get projects (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun())
+            return run_sync(self._arun())
 
         async def _arun(self) -> Dict[str, Any]:
             """Get all accessible projects."""
             await self.jira_tools._ensure_authenticated()
-            projects = await self.jira_tools.jira_client.get_projects()
+            projects = await self.jira_tools._cache.get_or_load(
+                ("projects",), _PROJECTS_TTL, self.jira_tools.jira_client.get_projects
+            )
             return {
                 "project_count": len(projects),
                 "projects": [
@@ -217,13 +304,16 @@ class JiraTools:
 
         def _run(self) -> Dict[str, Any]:
             """Validate Jira connection (synchronous)."""
-            import asyncio
-            return asyncio.run(self._arun())
+            return run_sync(self._arun())
 
         async def _arun(self) -> Dict[str, Any]:
             """Validate Jira connection."""
             await self.jira_tools._ensure_authenticated()
-            connection_info = await self.jira_tools.jira_client.validate_connection()
+            connection_info = await self.jira_tools._cache.get_or_load(
+                ("connection",),
+                _CONNECTION_TTL,
+                self.jira_tools.jira_client.validate_connection,
+            )
             return {
                 "status": "connected",
                 "connection_info": connection_info
@@ -231,10 +321,20 @@ class JiraTools:
 
     def get_tools(self) -> List[BaseTool]:
         """Get all Jira tools."""
-        return [
-            self.GetTicketsByFixVersionTool(self),
-            self.GetTicketTool(self),
-            self.SearchTicketsTool(self),
-            self.GetProjectsTool(self),
-            self.ValidateConnectionTool(self),
-        ] 
\ No newline at end of file
+        # Tools are stateless wrappers around this instance, so build them once
+        if self._tools is None:
+            self._tools = [
+                self.GetTicketsByFixVersionTool(self),
+                self.GetTicketTool(self),
+                self.BatchGetTicketsTool(self),
+                self.SearchTicketsTool(self),
+                self.GetProjectsTool(self),
+                self.ValidateConnectionTool(self),
+            ]
+        return list(self._tools)
+
+
+@lru_cache(maxsize=None)
+def get_jira_tools(use_mock: bool = True) -> JiraTools:
+    """Get the Jira tools shared across the process."""
+    return JiraTools(use_mock=use_mock)
@@ -0,0 +1,76 @@
+"""
+TTL cache for read-only tool lookups.
+
+Tools run from both the request event loop and the shared sync-runner loop,
+so entries are guarded by a thread lock that is never held across an await,
+and in-flight loads are shared through loop-agnostic concurrent futures.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 256):
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    async def get_or_load(
+        self, key: Hashable, ttl: float, loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return the cached value for key, loading it if missing or expired.
+
+        Concurrent misses for the same key wait for a single load; a ttl of
+        zero only shares in-flight loads and keeps nothing afterwards.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = Future()
+
+        if not owner:
+            # Shield so a cancelled waiter does not cancel the shared load
+            return await asyncio.shield(asyncio.wrap_future(pending))
+
+        try:
+            value = await loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            pending.set_exception(exc)
+            raise
+
+        with self._lock:
+            del self._inflight[key]
+            if ttl > 0:
+                self._store(key, ttl, value)
+        pending.set_result(value)
+        return value
+
+    def put(self, key: Hashable, ttl: float, value: Any) -> None:
+        """Store a value obtained elsewhere, e.g. as part of a bulk result."""
+        with self._lock:
+            self._store(key, ttl, value)
+
+    def _store(self, key: Hashable, ttl: float, value: Any) -> None:
+        """Insert an entry and evict the least recently used; caller holds the lock."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
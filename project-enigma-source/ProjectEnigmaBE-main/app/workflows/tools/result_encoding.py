@@ -0,0 +1,23 @@
+"""
+Off-loop encoding for large tool results.
+
+ToolNode JSON-encodes non-string tool output on the event loop. Results that
+are expected to be large are encoded in a worker thread instead and returned
+as that same string, so the resulting tool message is unchanged.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Union
+
+# Results estimated above this many bytes are JSON-encoded off the event loop
+OFFLOAD_ENCODING_THRESHOLD = 64 * 1024
+
+
+async def offload_large_result(
+    result: Dict[str, Any], size_hint: int
+) -> Union[Dict[str, Any], str]:
+    """Return result, pre-encoded in a worker thread when size_hint is large."""
+    if size_hint < OFFLOAD_ENCODING_THRESHOLD:
+        return result
+    return await asyncio.to_thread(json.dumps, result, ensure_ascii=False)
@@ -0,0 +1,65 @@
+"""
+Synchronous bridge for LangGraph tools.
+
+Tool ``_run`` methods are synchronous while the integration clients are
+async. Instead of building and tearing down an event loop per call with
+``asyncio.run``, every sync call is scheduled on one long-lived loop running
+on a daemon thread, so client and authentication state survive between calls.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Optional, TypeVar
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    # Windows, or uvicorn installed without its standard extras
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared tool loop, starting its thread on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                # Only this loop uses uvloop; the global loop policy is untouched
+                loop = (
+                    uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
+                )
+                threading.Thread(
+                    target=loop.run_forever, name="tools-event-loop", daemon=True
+                ).start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine to completion from synchronous code."""
+    loop = _get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        # Called from a coroutine on the shared loop itself; blocking on it
+        # would deadlock, so run on a private loop in a worker thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def run_in_background(coro: Awaitable[T]) -> "Future[T]":
+    """Schedule a coroutine on the shared loop without waiting for it."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
@@ -9,7 +9,7 @@ import asyncio
 import json
 import time
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from threading import Lock
@@ -37,16 +37,33 @@ class WorkflowMetadata:
     execution_time: float = 0.0
 
 
+@dataclass
+class _StateShard:
+    """One stripe of the state store, guarded by its own lock."""
+
+    store: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    metadata: Dict[str, WorkflowMetadata] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock)
+
+
 class WorkflowStateStore:
-    """Thread-safe in-memory state store with TTL cleanup."""
+    """Thread-safe in-memory state store with TTL cleanup.
+
+    Workflows are spread over a fixed number of shards, each with its own
+    lock, so concurrent workflows rarely contend on the same lock.
+    """
+
+    _SHARD_COUNT = 16  # must be a power of two
 
     def __init__(self, default_ttl_hours: int = 24):
-        self._store: Dict[str, Dict[str, Any]] = {}
-        self._metadata: Dict[str, WorkflowMetadata] = {}
-        self._lock = Lock()
+        self._shards = [_StateShard() for _ in range(self._SHARD_COUNT)]
         self.default_ttl_hours = default_ttl_hours
         self._start_cleanup_task()
 
+    def _shard(self, workflow_id: str) -> _StateShard:
+        """Return the shard that owns a workflow."""
+        return self._shards[hash(workflow_id) & (self._SHARD_COUNT - 1)]
+
     def _start_cleanup_task(self):
         """Start background task for TTL cleanup."""
 
@@ -65,57 +82,74 @@ class WorkflowStateStore:
         cleanup_thread.start()
 
     def _cleanup_expired(self):
-        """Remove expired workflow states."""
-        with self._lock:
-            now = datetime.now()
-            expired_ids = []
-
-            for workflow_id, metadata in self._metadata.items():
-                if now - metadata.updated_at > timedelta(hours=self.default_ttl_hours):
-                    expired_ids.append(workflow_id)
+        """Remove expired workflow states, one shard at a time."""
+        ttl = timedelta(hours=self.default_ttl_hours)
+        for shard in self._shards:
+            with shard.lock:
+                now = datetime.now()
+                expired_ids = [
+                    workflow_id
+                    for workflow_id, metadata in shard.metadata.items()
+                    if now - metadata.updated_at > ttl
+                ]
+
+                for workflow_id in expired_ids:
+                    shard.store.pop(workflow_id, None)
+                    shard.metadata.pop(workflow_id, None)
 
             for workflow_id in expired_ids:
-                self._store.pop(workflow_id, None)
-                self._metadata.pop(workflow_id, None)
                 print(f"Cleaned up expired workflow: {workflow_id}")
 
     def store_state(
         self, workflow_id: str, state: Dict[str, Any], metadata: WorkflowMetadata
     ) -> None:
         """Store workflow state with metadata."""
-        with self._lock:
+        state = state.copy()
+        shard = self._shard(workflow_id)
+        with shard.lock:
             metadata.updated_at = datetime.now()
-            self._store[workflow_id] = state.copy()
-            self._metadata[workflow_id] = metadata
+            shard.store[workflow_id] = state
+            shard.metadata[workflow_id] = metadata
 
     def get_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve workflow state."""
-        with self._lock:
-            return self._store.get(workflow_id)
+        shard = self._shard(workflow_id)
+        with shard.lock:
+            return shard.store.get(workflow_id)
 
     def get_metadata(self, workflow_id: str) -> Optional[WorkflowMetadata]:
         """Retrieve workflow metadata."""
-        with self._lock:
-            return self._metadata.get(workflow_id)
+        shard = self._shard(workflow_id)
+        with shard.lock:
+            return shard.metadata.get(workflow_id)
 
     def list_workflows(self) -> List[Dict[str, Any]]:
         """List all active workflows."""
-        with self._lock:
-            return [
-                {
-                    "workflow_id": workflow_id,
-                    "metadata": asdict(metadata),
-                    "state_size": len(str(self._store.get(workflow_id, {}))),
-                }
-                for workflow_id, metadata in self._metadata.items()
-            ]
+        snapshot = []
+        for shard in self._shards:
+            # Hold each lock only long enough to copy references out
+            with shard.lock:
+                snapshot.extend(
+                    (workflow_id, metadata, shard.store.get(workflow_id, {}))
+                    for workflow_id, metadata in shard.metadata.items()
+                )
+
+        return [
+            {
+                "workflow_id": workflow_id,
+                "metadata": asdict(metadata),
+                "state_size": len(str(state)),
+            }
+            for workflow_id, metadata, state in snapshot
+        ]
 
     def delete_workflow(self, workflow_id: str) -> bool:
         """Delete a workflow state."""
-        with self._lock:
-            state_existed = workflow_id in self._store
-            self._store.pop(workflow_id, None)
-            self._metadata.pop(workflow_id, None)
+        shard = self._shard(workflow_id)
+        with shard.lock:
+            state_existed = workflow_id in shard.store
+            shard.store.pop(workflow_id, None)
+            shard.metadata.pop(workflow_id, None)
             return state_existed
 
 
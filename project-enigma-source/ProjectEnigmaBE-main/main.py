@@ -57,19 +57,24 @@ async def lifespan(app: FastAPI):
     config_dir = Path("config")
     config_dir.mkdir(exist_ok=True)
     
-    # Initialize workflow system
-    try:
-        from app.workflows.initialization import initialize_workflow_system
-        initialize_workflow_system()
-        logger.info("Workflow system initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize workflow system: {e}")
-        # Don't fail startup, but log the error
-    
-    yield
-
-    # Shutdown
-    logger.info("Shutting down Project Enigma Backend API")
+    # One durable checkpointer per process, closed on shutdown; it must be
+    # open before the workflow graphs are compiled
+    from app.workflows.release_workflow import open_workflow_checkpointer
+
+    async with open_workflow_checkpointer():
+        # Initialize workflow system
+        try:
+            from app.workflows.initialization import initialize_workflow_system
+            initialize_workflow_system()
+            logger.info("Workflow system initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize workflow system: {e}")
+            # Don't fail startup, but log the error
+
+        yield
+
+        # Shutdown
+        logger.info("Shutting down Project Enigma Backend API")
 
 
 def create_app() -> FastAPI: